@@ -0,0 +1,37 @@
+"""Optional native build for Procur's hot service modules.
+
+Project metadata lives in ``pyproject.toml``; this file only adds Cython
+extensions. Set ``PROCUR_CYTHONIZE=1`` with Cython installed
+(``pip install -e .[speedups]``) to compile the modules below. The pure-Python
+sources are always shipped and are used whenever the compiled extension is
+missing.
+"""
+
+from __future__ import annotations
+
+import os
+
+from setuptools import setup
+
+CYTHON_MODULES = [
+    "src/procur/services/compliance_catalog.py",
+    "src/procur/services/compliance_service.py",
+    "src/procur/services/audit_service.py",
+    "src/procur/services/concession_engine.py",
+]
+
+
+def _ext_modules() -> list:
+    if os.environ.get("PROCUR_CYTHONIZE") != "1":
+        return []
+    try:
+        from Cython.Build import cythonize
+    except ImportError:
+        return []
+    return cythonize(
+        CYTHON_MODULES,
+        compiler_directives={"language_level": "3", "binding": True},
+    )
+
+
+setup(ext_modules=_ext_modules())
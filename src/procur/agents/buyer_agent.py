@@ -307,13 +307,7 @@ class BuyerAgent:
         concessions_engine = None
         if exchange_override:
             plan.exchange_policy = exchange_override
-            concessions_engine = ConcessionEngine(
-                {
-                    "term_trade": exchange_override.term_trade,
-                    "payment_trade": {term.value: pct for term, pct in exchange_override.payment_trade.items()},
-                    "value_add_offsets": exchange_override.value_add_offsets,
-                }
-            )
+            concessions_engine = ConcessionEngine.for_policy(exchange_override)
 
         opponent_model = OpponentModel(
             price_floor_estimate=(vendor.guardrails.price_floor or anchor_price) * 0.9,
@@ -368,7 +362,7 @@ class BuyerAgent:
             seller_floor = floor_price
 
         if competing_offers:
-            state.competing_offers = competing_offers
+            self.negotiation_engine.set_competing_offers(state, competing_offers)
 
         if budget_per_unit is not None and not detect_zopa(
             buyer_budget_per_unit=budget_per_unit,
@@ -1,12 +1,16 @@
 from __future__ import annotations
 
+import asyncio
 import os
 import time
 from typing import List, Optional
 
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
 import httpx
 
+# Optional chat-completion parameters forwarded verbatim when a caller sets them.
+_PASSTHROUGH_KWARGS = ("stop", "response_format", "extra_body")
+
 
 class LLMClient:
     """Wrapper around the NVIDIA-hosted OpenAI-compatible endpoint."""
@@ -45,6 +49,11 @@ class LLMClient:
             http_client=http_client,
             max_retries=max_retries
         )
+        self._base_url = base_url
+        self._api_key = api_key
+        # Async client and the event loop its pooled connections belong to.
+        self._async_client: Optional[AsyncOpenAI] = None
+        self._async_loop: Optional[asyncio.AbstractEventLoop] = None
         self.model = model
         self.timeout = timeout
         self.max_retries = max_retries
@@ -61,11 +70,13 @@ class LLMClient:
                     top_p=kwargs.get("top_p", 1.0),
                     max_tokens=kwargs.get("max_tokens", 4096),
                     stream=False,
+                    **{name: kwargs[name] for name in _PASSTHROUGH_KWARGS if name in kwargs},
                 )
                 choice = response.choices[0]
                 return {
                     "content": choice.message.content,
                     "reasoning": getattr(choice.message, "reasoning_content", None),
+                    "usage": self._usage(response),
                 }
             except (httpx.TimeoutException, httpx.ConnectError, httpx.ReadTimeout) as e:
                 last_exception = e
@@ -87,6 +98,63 @@ class LLMClient:
         # If we get here, all retries failed
         raise RuntimeError(f"LLM request failed after {self.max_retries + 1} attempts. Last error: {last_exception}")
     
+    async def acomplete(self, messages: List[dict], **kwargs) -> dict:
+        """Async :meth:`complete`; concurrent calls on one event loop share a connection pool."""
+        last_exception = None
+
+        for attempt in range(self.max_retries + 1):
+            try:
+                response = await self._async().chat.completions.create(
+                    model=self.model,
+                    messages=messages,
+                    temperature=kwargs.get("temperature", 1.0),
+                    top_p=kwargs.get("top_p", 1.0),
+                    max_tokens=kwargs.get("max_tokens", 4096),
+                    stream=False,
+                    **{name: kwargs[name] for name in _PASSTHROUGH_KWARGS if name in kwargs},
+                )
+                choice = response.choices[0]
+                return {
+                    "content": choice.message.content,
+                    "reasoning": getattr(choice.message, "reasoning_content", None),
+                    "usage": self._usage(response),
+                }
+            except Exception as e:
+                last_exception = e
+                if attempt < self.max_retries:
+                    await asyncio.sleep(min(2 ** attempt, 8))
+                    continue
+                break
+
+        raise RuntimeError(f"LLM request failed after {self.max_retries + 1} attempts. Last error: {last_exception}")
+
+    def _async(self) -> AsyncOpenAI:
+        # Pooled connections are bound to the loop that opened them, so a new
+        # loop (e.g. a second asyncio.run) gets a fresh client.
+        loop = asyncio.get_running_loop()
+        if self._async_client is None or self._async_loop is not loop:
+            self._async_loop = loop
+            self._async_client = AsyncOpenAI(
+                base_url=self._base_url,
+                api_key=self._api_key,
+                http_client=httpx.AsyncClient(
+                    timeout=httpx.Timeout(connect=10.0, read=self.timeout, write=10.0, pool=5.0)
+                ),
+                max_retries=0,  # acomplete retries itself
+            )
+        return self._async_client
+
+    @staticmethod
+    def _usage(response) -> dict:
+        """Token counts, including prompt tokens served from the provider's prefix cache."""
+        usage = getattr(response, "usage", None)
+        details = getattr(usage, "prompt_tokens_details", None)
+        return {
+            "prompt_tokens": getattr(usage, "prompt_tokens", None),
+            "completion_tokens": getattr(usage, "completion_tokens", None),
+            "cached_prompt_tokens": getattr(details, "cached_tokens", None),
+        }
+
     def generate_completion(self, prompt: str, **kwargs) -> str:
         """Generate completion from prompt (convenience method)."""
         messages = [{"role": "user", "content": prompt}]
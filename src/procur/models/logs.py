@@ -1,51 +1,96 @@
 from __future__ import annotations
 
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, List, Optional
-
-from pydantic import BaseModel, Field
+from typing import Dict, Iterable, List, Optional
 
 from .enums import ActorRole, NegotiationDecision
 from .offer import OfferComponents
 
+# Audit logs are produced internally by the negotiation loop and never parsed
+# from untrusted input, so they are plain slotted dataclasses rather than
+# pydantic models to keep per-move logging cheap.
+
 
-class UtilitySnapshot(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class UtilitySnapshot:
     buyer_utility: float
     seller_utility: float
     tco: float
-    buyer_components: Dict[str, float] = Field(default_factory=dict)
-    seller_components: Dict[str, float] = Field(default_factory=dict)
-    tco_breakdown: Dict[str, float] = Field(default_factory=dict)
+    buyer_components: Dict[str, float] = field(default_factory=dict)
+    seller_components: Dict[str, float] = field(default_factory=dict)
+    tco_breakdown: Dict[str, float] = field(default_factory=dict)
+
+    def as_dict(self) -> Dict[str, object]:
+        return {
+            "buyer_utility": self.buyer_utility,
+            "seller_utility": self.seller_utility,
+            "tco": self.tco,
+            "buyer_components": dict(self.buyer_components),
+            "seller_components": dict(self.seller_components),
+            "tco_breakdown": dict(self.tco_breakdown),
+        }
 
 
-class MoveLog(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class MoveLog:
     actor: ActorRole
     round_number: int
     offer: OfferComponents
     lever: str
-    rationale: List[str] = Field(default_factory=list)
+    rationale: List[str] = field(default_factory=list)
     utility: UtilitySnapshot
     decision: Optional[NegotiationDecision] = None
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
-    policy_notes: List[str] = Field(default_factory=list)
-    guardrail_notes: List[str] = Field(default_factory=list)
-    compliance_notes: List[str] = Field(default_factory=list)
+    timestamp: datetime = field(default_factory=datetime.utcnow)
+    policy_notes: List[str] = field(default_factory=list)
+    guardrail_notes: List[str] = field(default_factory=list)
+    compliance_notes: List[str] = field(default_factory=list)
 
+    def as_dict(self) -> Dict[str, object]:
+        return {
+            "actor": self.actor,
+            "round_number": self.round_number,
+            "offer": self.offer.model_dump(),
+            "lever": self.lever,
+            "rationale": list(self.rationale),
+            "utility": self.utility.as_dict(),
+            "decision": self.decision,
+            "timestamp": self.timestamp,
+            "policy_notes": list(self.policy_notes),
+            "guardrail_notes": list(self.guardrail_notes),
+            "compliance_notes": list(self.compliance_notes),
+        }
 
-class RoundLog(BaseModel):
+
+@dataclass(slots=True, kw_only=True)
+class RoundLog:
     request_id: str
     vendor_id: str
-    moves: List[MoveLog] = Field(default_factory=list)
+    moves: List[MoveLog] = field(default_factory=list)
     outcome: str = "in_progress"
-    summary: Dict[str, object] = Field(default_factory=dict)
-    started_at: datetime = Field(default_factory=datetime.utcnow)
+    summary: Dict[str, object] = field(default_factory=dict)
+    started_at: datetime = field(default_factory=datetime.utcnow)
     completed_at: Optional[datetime] = None
 
     def add_move(self, move: MoveLog) -> None:
         self.moves.append(move)
 
+    def add_moves(self, moves: Iterable[MoveLog]) -> None:
+        self.moves.extend(moves)
+
     def mark_outcome(self, outcome: str, summary: Optional[Dict[str, float]] = None) -> None:
         self.outcome = outcome
         if summary:
             self.summary = summary
         self.completed_at = datetime.utcnow()
+
+    def as_dict(self) -> Dict[str, object]:
+        return {
+            "request_id": self.request_id,
+            "vendor_id": self.vendor_id,
+            "moves": [move.as_dict() for move in self.moves],
+            "outcome": self.outcome,
+            "summary": dict(self.summary),
+            "started_at": self.started_at,
+            "completed_at": self.completed_at,
+        }
@@ -525,15 +525,7 @@ class NegotiationManager:
                 seller_floor = vendor_profile.guardrails.price_floor
                 estimated_min_price = None
                 if request.quantity:
-                    concessions = ConcessionEngine(
-                        {
-                            "term_trade": policy.term_trade,
-                            "payment_trade": {
-                                term.value: pct for term, pct in policy.payment_trade.items()
-                            },
-                            "value_add_offsets": policy.value_add_offsets,
-                        }
-                    )
+                    concessions = ConcessionEngine.for_policy(policy)
                     list_price = selection.record.list_price
                     floor_price = seller_floor or list_price
                     estimated_min_price, _ = concessions.best_effective_price(
@@ -959,13 +951,15 @@ class SaaSProcurementPipeline:
     ) -> Dict[str, bytes]:
         if not self.contract_generator:
             return {}
+        pending = {
+            vendor_id: self.contract_generator.submit(result.offer, request)
+            for vendor_id, result in negotiations.items()
+            if result.offer and result.offer.accepted
+        }
         contracts: Dict[str, bytes] = {}
-        for vendor_id, result in negotiations.items():
-            offer = result.offer
-            if not offer or not offer.accepted:
-                continue
+        for vendor_id, future in pending.items():
             try:
-                contracts[vendor_id] = self.contract_generator.generate_contract(offer, request)
+                contracts[vendor_id] = future.result()
             except ContractGenerationError as exc:
                 logger.warning("Contract generation failed for %s: %s", vendor_id, exc)
             except Exception as exc:  # pragma: no cover - defensive
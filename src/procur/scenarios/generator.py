@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Iterable, List, Optional
+from typing import Iterable, Optional
 
 from .schema import Scenario, ScenarioExchange, ScenarioEvaluationTargets, ScenarioRequest, ScenarioRisk, ScenarioSeller
 
@@ -24,7 +24,7 @@ def build_scenario(
     exchange: ScenarioExchange | None = None,
     risk: ScenarioRisk | None = None,
     eval_targets: ScenarioEvaluationTargets | None = None,
-    tags: Optional[List[str]] = None,
+    tags: Optional[Iterable[str]] = None,
 ) -> Scenario:
     return Scenario(
         scenario_id=scenario_id,
@@ -33,22 +33,22 @@ def build_scenario(
             category=category,
             quantity=quantity,
             budget_total=budget_total,
-            must_haves=list(must_haves or []),
-            compliance_requirements=list(compliance_requirements or []),
+            must_haves=tuple(must_haves or ()),
+            compliance_requirements=tuple(compliance_requirements or ()),
         ),
         seller=ScenarioSeller(
             name=seller_name,
             list_price=list_price,
             price_floor=price_floor,
-            term_options=list(term_options),
-            payment_options=list(payment_options),
-            non_negotiables=list(non_negotiables or []),
+            term_options=tuple(term_options),
+            payment_options=tuple(payment_options),
+            non_negotiables=tuple(non_negotiables or ()),
             behavior_profile=behavior_profile,
         ),
         exchange_table=exchange or ScenarioExchange(),
         risk=risk or ScenarioRisk(),
         eval_targets=eval_targets or ScenarioEvaluationTargets(),
-        tags=tags or [],
+        tags=tuple(tags or ()),
     )
 
 
@@ -63,7 +63,7 @@ def scenario_from_ratio(
     budget_ratio: float,
     term_options: Iterable[int] = (12, 24, 36),
     payment_options: Iterable[str] = ("NET30", "NET15", "NET45"),
-    tags: Optional[List[str]] = None,
+    tags: Optional[Iterable[str]] = None,
     compliance_requirements: Optional[Iterable[str]] = None,
 ) -> Scenario:
     price_floor = round(list_price * floor_ratio, 2)
@@ -81,5 +81,5 @@ def scenario_from_ratio(
         term_options=term_options,
         payment_options=payment_options,
         behavior_profile="auto_generated",
-        tags=tags or [],
+        tags=tags,
     )
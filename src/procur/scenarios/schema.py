@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import List, Optional
+from typing import Optional, Tuple
 
 from pydantic import BaseModel, Field
 
@@ -9,8 +9,8 @@ class ScenarioRequest(BaseModel):
     category: str
     quantity: int
     budget_total: float
-    must_haves: List[str] = Field(default_factory=list)
-    compliance_requirements: List[str] = Field(default_factory=list)
+    must_haves: Tuple[str, ...] = ()
+    compliance_requirements: Tuple[str, ...] = ()
     timeline_days: Optional[int] = None
 
 
@@ -18,9 +18,9 @@ class ScenarioSeller(BaseModel):
     name: str
     list_price: float
     price_floor: float
-    term_options: List[int]
-    payment_options: List[str]
-    non_negotiables: List[str] = Field(default_factory=list)
+    term_options: Tuple[int, ...]
+    payment_options: Tuple[str, ...]
+    non_negotiables: Tuple[str, ...] = ()
     behavior_profile: str = "general"
 
 
@@ -50,7 +50,7 @@ class Scenario(BaseModel):
     exchange_table: ScenarioExchange = Field(default_factory=ScenarioExchange)
     risk: ScenarioRisk = Field(default_factory=ScenarioRisk)
     eval_targets: ScenarioEvaluationTargets = Field(default_factory=ScenarioEvaluationTargets)
-    tags: List[str] = Field(default_factory=list)
+    tags: Tuple[str, ...] = ()
 
-    def tag_set(self) -> set[str]:
-        return set(self.tags)
+    def tag_set(self) -> frozenset[str]:
+        return frozenset(self.tags)
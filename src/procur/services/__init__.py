@@ -1,6 +1,6 @@
 """Deterministic services for Procur."""
 
-from .audit_service import AuditTrailService
+from .audit_service import AuditLevel, AuditTrailService
 from .compliance_service import ComplianceService, ComplianceFinding
 from .explainability_service import ExplainabilityService
 from .guardrail_service import GuardrailAlert, GuardrailService
@@ -23,6 +23,7 @@ from .llm_explainability import (
 __all__ = [
     "ComplianceService",
     "ComplianceFinding",
+    "AuditLevel",
     "AuditTrailService",
     "ExplainabilityService",
     "GuardrailAlert",
@@ -1,17 +1,52 @@
 from __future__ import annotations
 
-from collections import defaultdict
-from typing import Dict, Iterable, List, Optional
+from collections import defaultdict, deque
+from datetime import datetime
+from enum import Enum
+from typing import Deque, Dict, Iterable, List, Optional
+
+from pydantic_core import to_json
 
 from ..models import ActorRole, MoveLog, RoundLog, UtilitySnapshot
 
 
+def _copy_or_empty_dict(values: Optional[Dict[str, float]]) -> Dict[str, float]:
+    # Most moves carry no breakdown; skip the dict() copy of a throwaway {}.
+    return dict(values) if values else {}
+
+
+def _copy_or_empty_list(values: Optional[Iterable[str]]) -> List[str]:
+    return list(values) if values else []
+
+
+class AuditLevel(str, Enum):
+    """How much of a negotiation the audit trail retains."""
+
+    ALL = "all"  # moves, events and outcomes
+    WRITES_ONLY = "writes_only"  # moves and outcomes
+    MUTATIONS_ONLY = "mutations_only"  # session outcomes only
+    OFF = "off"
+
+
 class AuditTrailService:
-    """Collects structured negotiation logs for audit and playback."""
+    """Collects structured negotiation logs for audit and playback.
 
-    def __init__(self) -> None:
+    Moves are buffered as raw payloads and only materialised into ``MoveLog``
+    entries on :meth:`flush`, which runs automatically when a session buffer
+    fills up, on :meth:`finalize_session` and on :meth:`export_sessions`.
+    """
+
+    def __init__(
+        self,
+        audit_level: AuditLevel | str = AuditLevel.ALL,
+        max_buffered_moves: int = 256,
+    ) -> None:
+        self.audit_level = AuditLevel(audit_level)
+        self.max_buffered_moves = max(1, max_buffered_moves)
         self._sessions: Dict[tuple[str, str], RoundLog] = {}
-        self._events: Dict[str, List[dict]] = defaultdict(list)
+        self._event_names: Dict[str, List[str]] = defaultdict(list)
+        self._event_payloads: Dict[str, List[dict]] = defaultdict(list)
+        self._pending: Dict[tuple[str, str], Deque[dict]] = defaultdict(deque)
 
     def start_session(self, request_id: str, vendor_id: str) -> RoundLog:
         key = (request_id, vendor_id)
@@ -20,7 +55,10 @@ class AuditTrailService:
         return self._sessions[key]
 
     def record_event(self, request_id: str, name: str, payload: Optional[dict] = None) -> None:
-        self._events[request_id].append({"name": name, "payload": payload or {}})
+        if self.audit_level is not AuditLevel.ALL:
+            return
+        self._event_names[request_id].append(name)
+        self._event_payloads[request_id].append(payload or {})
 
     def record_move(
         self,
@@ -43,27 +81,103 @@ class AuditTrailService:
         seller_breakdown: Optional[Dict[str, float]] = None,
         tco_breakdown: Optional[Dict[str, float]] = None,
     ) -> None:
-        session = self.start_session(request_id, vendor_id)
-        move = MoveLog(
-            actor=actor,
-            round_number=round_number,
-            offer=offer,
-            lever=lever,
-            rationale=list(rationale),
+        if self.audit_level not in (AuditLevel.ALL, AuditLevel.WRITES_ONLY):
+            return
+        key = (request_id, vendor_id)
+        pending = self._pending[key]
+        pending.append(
+            {
+                "actor": actor,
+                "round_number": round_number,
+                "offer": offer,
+                "lever": lever,
+                "rationale": rationale,
+                "buyer_utility": buyer_utility,
+                "seller_utility": seller_utility,
+                "tco": tco,
+                "decision": decision,
+                "policy_notes": policy_notes,
+                "guardrail_notes": guardrail_notes,
+                "compliance_notes": compliance_notes,
+                "buyer_breakdown": buyer_breakdown,
+                "seller_breakdown": seller_breakdown,
+                "tco_breakdown": tco_breakdown,
+                "timestamp": datetime.utcnow(),
+            }
+        )
+        if len(pending) >= self.max_buffered_moves:
+            self._flush_session(key)
+
+    def flush(self, request_id: Optional[str] = None) -> None:
+        """Materialise buffered moves, optionally for a single request only."""
+        keys = [key for key in self._pending if request_id is None or key[0] == request_id]
+        for key in keys:
+            self._flush_session(key)
+
+    def _flush_session(self, key: tuple[str, str]) -> None:
+        pending = self._pending.pop(key, None)
+        if not pending:
+            return
+        session = self.start_session(*key)
+        session.add_moves(self._build_move(raw) for raw in pending)
+
+    @staticmethod
+    def _build_move(raw: dict) -> MoveLog:
+        return MoveLog(
+            actor=raw["actor"],
+            round_number=raw["round_number"],
+            offer=raw["offer"],
+            lever=raw["lever"],
+            rationale=list(raw["rationale"]),
             utility=UtilitySnapshot(
-                buyer_utility=buyer_utility,
-                seller_utility=seller_utility,
-                tco=tco,
-                buyer_components=dict(buyer_breakdown or {}),
-                seller_components=dict(seller_breakdown or {}),
-                tco_breakdown=dict(tco_breakdown or {}),
+                buyer_utility=raw["buyer_utility"],
+                seller_utility=raw["seller_utility"],
+                tco=raw["tco"],
+                buyer_components=_copy_or_empty_dict(raw["buyer_breakdown"]),
+                seller_components=_copy_or_empty_dict(raw["seller_breakdown"]),
+                tco_breakdown=_copy_or_empty_dict(raw["tco_breakdown"]),
             ),
-            decision=decision,
-            policy_notes=list(policy_notes or []),
-            guardrail_notes=list(guardrail_notes or []),
-            compliance_notes=list(compliance_notes or []),
+            decision=raw["decision"],
+            timestamp=raw["timestamp"],
+            policy_notes=_copy_or_empty_list(raw["policy_notes"]),
+            guardrail_notes=_copy_or_empty_list(raw["guardrail_notes"]),
+            compliance_notes=_copy_or_empty_list(raw["compliance_notes"]),
         )
-        session.add_move(move)
+
+    def component_totals(self, request_id: str, vendor_id: str) -> Dict[str, Dict[str, float]]:
+        """Sum utility and TCO components across every move recorded for a session.
+
+        Buffered moves are read straight from their raw payloads, so no
+        ``MoveLog`` needs to be materialised for the rollup.
+        """
+        key = (request_id, vendor_id)
+        breakdowns: List[tuple] = []
+        session = self._sessions.get(key)
+        if session is not None:
+            breakdowns.extend(
+                (
+                    move.utility.buyer_components,
+                    move.utility.seller_components,
+                    move.utility.tco_breakdown,
+                )
+                for move in session.moves
+            )
+        breakdowns.extend(
+            (raw["buyer_breakdown"], raw["seller_breakdown"], raw["tco_breakdown"])
+            for raw in self._pending.get(key, ())
+        )
+
+        totals: Dict[str, Dict[str, float]] = {
+            "buyer_components": defaultdict(float),
+            "seller_components": defaultdict(float),
+            "tco_breakdown": defaultdict(float),
+        }
+        columns = (totals["buyer_components"], totals["seller_components"], totals["tco_breakdown"])
+        for row in breakdowns:
+            for column, breakdown in zip(columns, row):
+                for name, value in (breakdown or {}).items():
+                    column[name] += value
+        return {name: dict(column) for name, column in totals.items()}
 
     def finalize_session(
         self,
@@ -73,18 +187,46 @@ class AuditTrailService:
         outcome: str,
         summary: Optional[Dict[str, object]] = None,
     ) -> None:
+        if self.audit_level is AuditLevel.OFF:
+            return
+        self._flush_session((request_id, vendor_id))
         session = self.start_session(request_id, vendor_id)
         session.mark_outcome(outcome, summary)
 
     def export_sessions(self, request_id: str) -> Dict[str, dict]:
+        sessions, events = self._collect_export(request_id)
         payload: Dict[str, dict] = {
-            vendor_id: session.model_dump()
+            vendor_id: session.as_dict() for vendor_id, session in sessions.items()
+        }
+        return {"round_logs": payload, "events": events}
+
+    def export_sessions_json(self, request_id: str) -> bytes:
+        """Encode the same payload as :meth:`export_sessions` straight to JSON.
+
+        Sessions are serialised by pydantic-core without building the
+        intermediate ``as_dict`` payloads.
+        """
+        sessions, events = self._collect_export(request_id)
+        return to_json({"round_logs": sessions, "events": events}, serialize_unknown=True)
+
+    def _collect_export(self, request_id: str) -> tuple[Dict[str, RoundLog], List[dict]]:
+        self.flush(request_id)
+        sessions = {
+            vendor_id: session
             for (req_id, vendor_id), session in self._sessions.items()
             if req_id == request_id
         }
-        events = self._events.get(request_id, [])
-        return {"round_logs": payload, "events": events}
+        events = [
+            {"name": name, "payload": event_payload}
+            for name, event_payload in zip(
+                self._event_names.get(request_id, ()),
+                self._event_payloads.get(request_id, ()),
+            )
+        ]
+        return sessions, events
 
     def clear(self) -> None:
         self._sessions.clear()
-        self._events.clear()
+        self._event_names.clear()
+        self._event_payloads.clear()
+        self._pending.clear()
@@ -1,12 +1,15 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Iterable, List
+from typing import Dict, Iterable, List
 
 from ..models import ControlStatus, Request, RiskCard, RiskLevel, VendorProfile
 from .compliance_catalog import lookup_compliance, normalize_identifier
 
 
+_REGIONAL_FALLBACKS = frozenset({"eu", "us"})
+
+
 @dataclass
 class ComplianceFinding:
     code: str
@@ -50,39 +53,34 @@ class ComplianceService:
         self.mandatory_certifications = mandatory_certifications or []
 
     def _missing_tags(self, vendor: VendorProfile, tags: Iterable[str]) -> List[str]:
-        missing: List[str] = []
+        originals = {tag.lower(): tag for tag in tags}
         vendor_tags = {tag.lower() for tag in vendor.capability_tags}
         vendor_certs = {cert.lower() for cert in vendor.certifications}
-        for tag in tags:
-            normalized = tag.lower()
-            if normalized not in vendor_tags and normalized not in vendor_certs:
-                missing.append(tag)
-        return missing
+        missing = originals.keys() - vendor_tags - vendor_certs
+        # Walk the mapping rather than the set so findings keep request order.
+        return [original for normalized, original in originals.items() if normalized in missing]
 
     def assess_vendor(self, request: Request, vendor: VendorProfile) -> ComplianceAssessment:
         statuses: List[ComplianceStatus] = []
         vendor_certs = {normalize_identifier(cert) for cert in vendor.certifications}
         vendor_regions = {normalize_identifier(region) for region in vendor.regions}
+        # Regional frameworks are treated as covered when the vendor operates there.
+        region_hits = _REGIONAL_FALLBACKS & vendor_regions
 
         for requirement in request.compliance_requirements:
             entry = lookup_compliance(requirement)
             if entry:
-                tokens = {normalize_identifier(entry["id"]) }
-                tokens.update(normalize_identifier(alias) for alias in entry.get("aliases", []))
-                name = entry["name"]  # type: ignore[index]
-                blocking = bool(entry.get("blocking", True))
-                region = entry.get("region")
+                tokens = entry.tokens
+                name = entry.name
+                blocking = entry.blocking
+                region = entry.region
             else:
                 tokens = {normalize_identifier(requirement)}
                 name = requirement.upper()
                 blocking = True
                 region = None
 
-            compliant = bool(tokens & vendor_certs)
-            if not compliant and region == "eu" and "eu" in vendor_regions:
-                compliant = True
-            if not compliant and region == "us" and "us" in vendor_regions:
-                compliant = True
+            compliant = bool(tokens & vendor_certs) or region in region_hits
 
             if compliant:
                 status = ComplianceStatus(
@@ -105,20 +103,25 @@ class ComplianceService:
         return ComplianceAssessment(statuses=statuses)
 
     def evaluate_vendor(self, request: Request, vendor: VendorProfile) -> List[ComplianceFinding]:
-        findings: List[ComplianceFinding] = []
+        # Keyed by (code, message) so overlapping checks report a gap only once.
+        findings: Dict[tuple[str, str], ComplianceFinding] = {}
 
+        def add(finding: ComplianceFinding) -> None:
+            findings.setdefault((finding.code, finding.message), finding)
+
+        vendor_certs = set(vendor.certifications)
         for cert in self.mandatory_certifications:
-            if cert not in vendor.certifications:
-                findings.append(
+            if cert not in vendor_certs:
+                add(
                     ComplianceFinding(
                         code="missing_certification",
                         message=f"Vendor missing required certification {cert}",
                     )
                 )
 
-        must_have_missing = set(self._missing_tags(vendor, request.must_haves))
+        must_have_missing = self._missing_tags(vendor, request.must_haves)
         for tag in must_have_missing:
-            findings.append(
+            add(
                 ComplianceFinding(
                     code="missing_must_have",
                     message=f"Vendor lacks required capability or certification '{tag}'",
@@ -127,7 +130,7 @@ class ComplianceService:
 
         residency = request.specs.get("data_residency")
         if residency and residency not in vendor.regions:
-            findings.append(
+            add(
                 ComplianceFinding(
                     code="data_residency_mismatch",
                     message=f"Residency requirement {residency} not met by vendor regions {vendor.regions}",
@@ -136,7 +139,7 @@ class ComplianceService:
 
         sensitivity = (request.data_sensitivity or "").lower()
         if sensitivity in {"restricted", "high"} and vendor.risk_level != RiskLevel.LOW:
-            findings.append(
+            add(
                 ComplianceFinding(
                     code="risk_too_high",
                     message=f"Vendor risk level {vendor.risk_level.value} incompatible with {sensitivity} data",
@@ -146,7 +149,7 @@ class ComplianceService:
         required_value_adds = request.specs.get("value_add_requirements", [])
         missing_value_adds = self._missing_tags(vendor, required_value_adds)
         for value_add in missing_value_adds:
-            findings.append(
+            add(
                 ComplianceFinding(
                     code="value_add_missing",
                     message=f"Vendor cannot satisfy required value-add '{value_add}'",
@@ -157,7 +160,7 @@ class ComplianceService:
         assessment = self.assess_vendor(request, vendor)
         for status in assessment.statuses:
             if status.status != "compliant":
-                findings.append(
+                add(
                     ComplianceFinding(
                         code="compliance_missing",
                         message=status.reason,
@@ -165,15 +168,16 @@ class ComplianceService:
                     )
                 )
 
-        return findings
+        return list(findings.values())
 
     def build_risk_card(self, request: Request, vendor: VendorProfile) -> RiskCard:
         findings = self.evaluate_vendor(request, vendor)
         must_have_missing = set(self._missing_tags(vendor, request.must_haves))
+        vendor_certs = set(vendor.certifications)
         controls = [
             ControlStatus(
                 name=cert,
-                compliant=cert in vendor.certifications,
+                compliant=cert in vendor_certs,
             )
             for cert in self.mandatory_certifications
         ]
@@ -0,0 +1,162 @@
+"""Lever-combination search behind seller concession estimates.
+
+Kept separate from :mod:`procur.services.negotiation_engine` so it can be
+compiled by the optional Cython build (see ``setup.py``); the negotiation engine
+re-exports :class:`ConcessionEngine`.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import TYPE_CHECKING, Dict, List, Tuple
+
+try:  # pragma: no cover - optional dependency
+    import numpy as np  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency
+    np = None  # type: ignore[assignment]
+
+if TYPE_CHECKING:  # pragma: no cover - import cycle
+    from .negotiation_engine import ExchangePolicy
+
+
+class ConcessionEngine:
+    """Utility to convert vendor concessions to monetary impacts."""
+
+    def __init__(self, record_metadata: Dict[str, object]) -> None:
+        self.term_trade: Dict[int, float] = {
+            int(k): float(v) for k, v in record_metadata.get("term_trade", {}).items()
+        }
+        self.payment_trade: Dict[str, float] = {
+            str(k): float(v) for k, v in record_metadata.get("payment_trade", {}).items()
+        }
+        self.value_add_offsets: Dict[str, float] = {
+            str(k): float(v) for k, v in record_metadata.get("value_add_offsets", {}).items()
+        }
+        self._combination_tables = (self._build_combination_table(False), self._build_combination_table(True))
+
+    @classmethod
+    def for_policy(cls, policy: ExchangePolicy) -> "ConcessionEngine":
+        """Shared engine for ``policy``; cached on the policy's current rates."""
+        return _concession_engine_for_policy(_policy_key(policy))
+
+    def _build_combination_table(self, with_credit: bool) -> tuple:
+        """Flatten every lever combination into one row per candidate.
+
+        Each candidate is priced as ``list_price * (1 - payment) * (1 - term) -
+        credit * per_seat_credit`` with zeros for unused levers. Rows run from
+        single levers through pairs to the payment+term+value-add triples (top
+        two payment and term options only); the earliest row wins a tie. Labels
+        do not depend on the list price, so they are formatted once here.
+        """
+        payments = [(k, v) for k, v in self.payment_trade.items() if v > 0]
+        terms = [(k, v) for k, v in self.term_trade.items() if v > 0]
+        total_credit = sum(self.value_add_offsets.values())
+        credit_label = f"value_add:${total_credit:.2f}"
+
+        def payment_label(key, discount):
+            return f"payment:{key}:{discount:.2%}"
+
+        def term_label(delta, discount):
+            return f"term:+{delta}:{discount:.2%}"
+
+        rows: List[Tuple[float, float, float, List[str]]] = []
+        rows.extend((d, 0.0, 0.0, [payment_label(k, d)]) for k, d in payments)
+        rows.extend((0.0, d, 0.0, [term_label(k, d)]) for k, d in terms)
+        if with_credit:
+            rows.append((0.0, 0.0, 1.0, [credit_label]))
+        rows.extend(
+            (pd, td, 0.0, [payment_label(pk, pd), term_label(tk, td)])
+            for pk, pd in payments
+            for tk, td in terms
+        )
+        if with_credit:
+            rows.extend((d, 0.0, 1.0, [payment_label(k, d), credit_label]) for k, d in payments)
+            rows.extend((0.0, d, 1.0, [term_label(k, d), credit_label]) for k, d in terms)
+            top_payments = sorted(payments, key=lambda x: x[1], reverse=True)[:2]
+            top_terms = sorted(terms, key=lambda x: x[1], reverse=True)[:2]
+            rows.extend(
+                (pd, td, 1.0, [payment_label(pk, pd), term_label(tk, td), credit_label])
+                for pk, pd in top_payments
+                for tk, td in top_terms
+            )
+
+        payment_factor = [1 - row[0] for row in rows]
+        term_factor = [1 - row[1] for row in rows]
+        credit_flag = [row[2] for row in rows]
+        if np is not None:
+            payment_factor = np.array(payment_factor, dtype=np.float64)
+            term_factor = np.array(term_factor, dtype=np.float64)
+            credit_flag = np.array(credit_flag, dtype=np.float64)
+        return payment_factor, term_factor, credit_flag, [row[3] for row in rows], total_credit
+
+    def best_effective_price(
+        self,
+        *,
+        list_price: float,
+        floor_price: float,
+        seats: int,
+    ) -> Tuple[float, List[str]]:
+        """Evaluate combinations of levers to find the best effective price."""
+        with_credit = seats > 0 and bool(self.value_add_offsets)
+        payment_factor, term_factor, credit_flag, labels, total_credit = self._combination_tables[with_credit]
+        if not labels:
+            return list_price, []
+        per_seat_credit = total_credit / seats if with_credit else 0.0
+
+        if np is not None:
+            prices = list_price * payment_factor * term_factor
+            if with_credit:
+                prices = prices - credit_flag * per_seat_credit
+            feasible = np.where((prices >= floor_price) & (prices < list_price), prices, np.inf)
+            best = int(np.argmin(feasible))
+            if feasible[best] == np.inf:
+                return list_price, []
+            return float(prices[best]), list(labels[best])
+
+        # Track the best candidate inline; only the winner's labels are copied.
+        best_price = list_price
+        best_row = -1
+        for row, (pf, tf, flag) in enumerate(zip(payment_factor, term_factor, credit_flag)):
+            price = list_price * pf * tf
+            if with_credit:
+                price = price - flag * per_seat_credit
+            if floor_price <= price < best_price:
+                best_price = price
+                best_row = row
+        return best_price, (list(labels[best_row]) if best_row >= 0 else [])
+
+
+def _policy_key(policy: ExchangePolicy) -> tuple:
+    # ExchangePolicy is mutable, so key on its content rather than its identity.
+    # Item order is kept: it decides which levers win a tie.
+    return (
+        tuple(policy.term_trade.items()),
+        tuple((term.value, pct) for term, pct in policy.payment_trade.items()),
+        tuple(policy.value_add_offsets.items()),
+    )
+
+
+@lru_cache(maxsize=256)
+def _concession_engine_for_policy(policy_key: tuple) -> "ConcessionEngine":
+    term_trade, payment_trade, value_add_offsets = policy_key
+    return ConcessionEngine(
+        {
+            "term_trade": dict(term_trade),
+            "payment_trade": dict(payment_trade),
+            "value_add_offsets": dict(value_add_offsets),
+        }
+    )
+
+
+@lru_cache(maxsize=4096)
+def _best_effective_price_for_policy(
+    policy_key: tuple, list_price: float, floor_price: float, seats: int
+) -> Tuple[float, Tuple[str, ...]]:
+    # feasible_with_trades probes the same (policy, price, floor, seats) many
+    # times per session; callers get an immutable tuple of applied levers.
+    best_price, applied = _concession_engine_for_policy(policy_key).best_effective_price(
+        list_price=list_price,
+        floor_price=floor_price,
+        seats=seats,
+    )
+    return best_price, tuple(applied)
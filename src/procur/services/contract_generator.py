@@ -1,9 +1,12 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import asyncio
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Final, Optional
 
 try:  # pragma: no cover - optional dependency
     from jinja2 import Template  # type: ignore
@@ -18,6 +21,50 @@ except ImportError:  # pragma: no cover - optional dependency
     pdfkit = None
 
 
+_DEFAULT_TEMPLATE: Final[str] = """
+<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="utf-8" />
+    <title>Software License Agreement</title>
+    <style>
+        body { font-family: Arial, sans-serif; margin: 1.5rem; line-height: 1.6; }
+        h1 { text-transform: uppercase; letter-spacing: 0.1em; }
+        section { margin-bottom: 1.25rem; }
+        .summary { background: #f5f7fa; padding: 1rem; border-radius: 6px; }
+        table { width: 100%; border-collapse: collapse; }
+        td { padding: 0.35rem 0; }
+        strong { font-weight: 600; }
+    </style>
+</head>
+<body>
+    <h1>Software License Agreement</h1>
+    <section class="summary">
+        <p><strong>Vendor:</strong> {{ vendor_name }}</p>
+        <p><strong>Customer:</strong> {{ customer_name }}</p>
+        <p><strong>Agreement Date:</strong> {{ date }}</p>
+    </section>
+    <section>
+        <table>
+            <tr><td><strong>Price</strong></td><td>${{ "%.2f" % price }} per {{ billing_cycle }}</td></tr>
+            <tr><td><strong>Term</strong></td><td>{{ term_months }} months</td></tr>
+            <tr><td><strong>Quantity</strong></td><td>{{ quantity }}</td></tr>
+            <tr><td><strong>Currency</strong></td><td>{{ currency }}</td></tr>
+            <tr><td><strong>Payment Terms</strong></td><td>{{ payment_terms }}</td></tr>
+            <tr><td><strong>SLA</strong></td><td>{{ sla_terms }}</td></tr>
+        </table>
+    </section>
+    <section>
+        <p>This agreement was generated by Procur AI for request {{ request_id }}. Any negotiated notes:</p>
+        <p>{{ notes }}</p>
+    </section>
+</body>
+</html>
+"""
+
+_DEFAULT_COMPILED = Template(_DEFAULT_TEMPLATE) if Template is not None else None
+
+
 class ContractGenerationError(RuntimeError):
     """Raised when a contract cannot be generated."""
 
@@ -28,6 +75,35 @@ class ContractGenerator:
 
     template_path: Optional[Path] = None
     template_variables: Optional[Dict[str, object]] = None
+    max_workers: int = 2
+    _executor: Optional[ThreadPoolExecutor] = field(default=None, init=False, repr=False, compare=False)
+    _executor_lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False, compare=False)
+
+    def submit(self, offer: Offer, request: Request) -> Future[bytes]:
+        """Render a contract on the background pool and return its future."""
+        return self._pool().submit(self.generate_contract, offer, request)
+
+    async def generate_contract_async(self, offer: Offer, request: Request) -> bytes:
+        """Render a contract without blocking the running event loop."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._pool(), self.generate_contract, offer, request)
+
+    def shutdown(self, wait: bool = True) -> None:
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+    def _pool(self) -> ThreadPoolExecutor:
+        # wkhtmltopdf runs out of process, so a small thread pool is enough to
+        # keep PDF rendering off the caller's thread.
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=max(1, self.max_workers),
+                    thread_name_prefix="procur-contract",
+                )
+            return self._executor
 
     def generate_contract(self, offer: Offer, request: Request) -> bytes:
         """Render a PDF contract for the negotiated offer."""
@@ -65,11 +141,9 @@ class ContractGenerator:
     def _load_template(self) -> Template:
         if Template is None:  # pragma: no cover - guarded by caller
             raise ContractGenerationError("jinja2 is not installed")
-        if self.template_path:
-            template_text = self.template_path.read_text(encoding="utf-8")
-        else:
-            template_text = self._default_template()
-        return Template(template_text)
+        if not self.template_path:
+            return _DEFAULT_COMPILED
+        return Template(self.template_path.read_text(encoding="utf-8"))
 
     def _render_pdf(self, html: str) -> bytes:
         if pdfkit is None:
@@ -103,48 +177,7 @@ class ContractGenerator:
 
     @staticmethod
     def _default_template() -> str:
-        return (
-            """
-            <!DOCTYPE html>
-            <html lang="en">
-            <head>
-                <meta charset="utf-8" />
-                <title>Software License Agreement</title>
-                <style>
-                    body { font-family: Arial, sans-serif; margin: 1.5rem; line-height: 1.6; }
-                    h1 { text-transform: uppercase; letter-spacing: 0.1em; }
-                    section { margin-bottom: 1.25rem; }
-                    .summary { background: #f5f7fa; padding: 1rem; border-radius: 6px; }
-                    table { width: 100%; border-collapse: collapse; }
-                    td { padding: 0.35rem 0; }
-                    strong { font-weight: 600; }
-                </style>
-            </head>
-            <body>
-                <h1>Software License Agreement</h1>
-                <section class="summary">
-                    <p><strong>Vendor:</strong> {{ vendor_name }}</p>
-                    <p><strong>Customer:</strong> {{ customer_name }}</p>
-                    <p><strong>Agreement Date:</strong> {{ date }}</p>
-                </section>
-                <section>
-                    <table>
-                        <tr><td><strong>Price</strong></td><td>${{ "%.2f" % price }} per {{ billing_cycle }}</td></tr>
-                        <tr><td><strong>Term</strong></td><td>{{ term_months }} months</td></tr>
-                        <tr><td><strong>Quantity</strong></td><td>{{ quantity }}</td></tr>
-                        <tr><td><strong>Currency</strong></td><td>{{ currency }}</td></tr>
-                        <tr><td><strong>Payment Terms</strong></td><td>{{ payment_terms }}</td></tr>
-                        <tr><td><strong>SLA</strong></td><td>{{ sla_terms }}</td></tr>
-                    </table>
-                </section>
-                <section>
-                    <p>This agreement was generated by Procur AI for request {{ request_id }}. Any negotiated notes:</p>
-                    <p>{{ notes }}</p>
-                </section>
-            </body>
-            </html>
-            """
-        )
+        return _DEFAULT_TEMPLATE
 
 
 __all__ = ["ContractGenerator", "ContractGenerationError"]
@@ -3,35 +3,74 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from decimal import Decimal, ROUND_HALF_UP, getcontext
-from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+from decimal import ROUND_HALF_UP, Context, Decimal
+from functools import lru_cache
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Tuple, Union
 
+try:  # pragma: no cover - optional dependency
+    import numpy as np  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency
+    np = None  # type: ignore[assignment]
 
-getcontext().prec = 28
+_ZERO = Decimal(0)
+# Private context for the few Decimal operations left in this module, so importing
+# it no longer rewrites the caller's thread-wide decimal context.
+_MONEY_CONTEXT = Context(prec=28, rounding=ROUND_HALF_UP)
 
 
 def _d(value: float | int | str | Decimal) -> Decimal:
     if isinstance(value, Decimal):
         return value
+    if isinstance(value, int):
+        return Decimal(value)
     return Decimal(str(value))
 
 
-def _round_money(value: Decimal) -> Decimal:
-    return value.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+def _ratio(value: float | int | str | Decimal) -> Tuple[int, int]:
+    # Seats and term months are plain ints; skip the Decimal round-trip for them.
+    if isinstance(value, int):
+        return value, 1
+    return _d(value).as_integer_ratio()
 
 
-@dataclass(frozen=True)
+def _round_half_up(numerator: int, denominator: int) -> int:
+    """Round ``numerator / denominator`` to an int, halves away from zero (ROUND_HALF_UP)."""
+    quotient, remainder = divmod(abs(numerator), denominator)
+    if 2 * remainder >= denominator:
+        quotient += 1
+    return quotient if numerator >= 0 else -quotient
+
+
+def _cents(value: float | int | str | Decimal) -> int:
+    numerator, denominator = _ratio(value)
+    return _round_half_up(numerator * 100, denominator)
+
+
+def _from_cents(cents: int) -> Decimal:
+    return Decimal(cents).scaleb(-2, _MONEY_CONTEXT)
+
+
+def _clamp01(value: float) -> float:
+    # Same results as float(max(0.0, min(value, 1.0))), NaN -> 0.0 included.
+    if 0.0 <= value <= 1.0:
+        return float(value)
+    return 1.0 if value > 1.0 else 0.0
+
+
+@dataclass(frozen=True, slots=True)
 class TCOInputs:
     unit_price: Decimal
     seats: int
     term_months: int
-    one_time_fees: Decimal = Decimal("0")
-    credits: Decimal = Decimal("0")
+    one_time_fees: Decimal = _ZERO
+    credits: Decimal = _ZERO
     payment_prepaid: bool = False
-    prepay_discount_rate: Decimal = Decimal("0")
+    prepay_discount_rate: Decimal = _ZERO
+    # Integer basis points (500 == 5%); takes precedence over prepay_discount_rate when set.
+    prepay_discount_bp: int = 0
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TCOBreakdown:
     base: Decimal
     one_time_fees: Decimal
@@ -50,18 +89,33 @@ class TCOBreakdown:
 
 
 def compute_tco(inputs: TCOInputs) -> TCOBreakdown:
-    base = _round_money(inputs.unit_price * _d(inputs.seats) * _d(inputs.term_months) / Decimal("12"))
-    one_time = _round_money(inputs.one_time_fees)
-    credits = _round_money(inputs.credits)
-    prepay_adj = Decimal("0")
-    if inputs.payment_prepaid and inputs.prepay_discount_rate:
-        prepay_adj = _round_money(-(base * inputs.prepay_discount_rate))
-    total = _round_money(base + one_time - credits + prepay_adj)
-
-    if abs((base + one_time - credits + prepay_adj) - total) > Decimal("0.01"):
-        raise ValueError("TCO invariant violated: rounding drift exceeds tolerance")
-
-    return TCOBreakdown(base=base, one_time_fees=one_time, credits=credits, prepay_adj=prepay_adj, total=total)
+    # Money is carried as exact integer cents; Decimal only appears on the
+    # TCOBreakdown boundary. Every component is rounded to the cent before
+    # summing, so the total cannot drift from its parts.
+    price_num, price_den = _ratio(inputs.unit_price)
+    seats_num, seats_den = _ratio(inputs.seats)
+    term_num, term_den = _ratio(inputs.term_months)
+    base = _round_half_up(
+        price_num * seats_num * term_num * 100,
+        price_den * seats_den * term_den * 12,
+    )
+    one_time = _cents(inputs.one_time_fees)
+    credits = _cents(inputs.credits)
+    prepay_adj = 0
+    if inputs.payment_prepaid and inputs.prepay_discount_bp:
+        prepay_adj = _round_half_up(-base * inputs.prepay_discount_bp, 10_000)
+    elif inputs.payment_prepaid and inputs.prepay_discount_rate:
+        rate_num, rate_den = _ratio(inputs.prepay_discount_rate)
+        prepay_adj = _round_half_up(-base * rate_num, rate_den)
+    total = base + one_time - credits + prepay_adj
+
+    return TCOBreakdown(
+        base=_from_cents(base),
+        one_time_fees=_from_cents(one_time),
+        credits=_from_cents(credits),
+        prepay_adj=_from_cents(prepay_adj),
+        total=_from_cents(total),
+    )
 
 
 FEATURE_SYNONYMS: Mapping[str, Sequence[str]] = {
@@ -73,42 +127,57 @@ FEATURE_SYNONYMS: Mapping[str, Sequence[str]] = {
 }
 
 
+def _build_feature_lookup() -> Dict[str, str]:
+    lookup: Dict[str, str] = {}
+    # setdefault keeps the first canonical form when variants overlap.
+    for canonical, variants in FEATURE_SYNONYMS.items():
+        lookup.setdefault(canonical.lower().strip(), canonical)
+        for variant in variants:
+            lookup.setdefault(variant.lower().strip().replace("_", " ").replace("-", " "), canonical)
+    return lookup
+
+
+_FEATURE_LOOKUP: Dict[str, str] = _build_feature_lookup()
+
+
+@lru_cache(maxsize=4096)
 def normalize_feature_token(token: str) -> str:
     lowered = token.lower().strip().replace("_", " ").replace("-", " ")
     lowered = " ".join(lowered.split())
-    for canonical, variants in FEATURE_SYNONYMS.items():
-        norm_canonical = canonical.lower().strip()
-        if lowered == norm_canonical:
-            return canonical
-        for variant in variants:
-            if lowered == variant.lower().strip().replace("_", " ").replace("-", " "):
-                return canonical
-    return lowered
+    return _FEATURE_LOOKUP.get(lowered, lowered)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FeatureMatchResult:
     score: float
     matched: List[str]
     missing: List[str]
 
 
+OptionalFeatures = Union[Mapping[str, float], Sequence[Tuple[str, float]]]
+
+
+def prepare_optional_features(optional_features: Mapping[str, float]) -> Tuple[Tuple[str, float], ...]:
+    """Normalise optional-feature keys once so they can be reused across vendors.
+
+    Pass the result to :func:`compute_feature_score` in place of the mapping when
+    scoring many vendors against the same request.
+    """
+    return tuple((normalize_feature_token(key), weight) for key, weight in optional_features.items())
+
+
 def compute_feature_score(
     must_haves: Sequence[str],
     vendor_features: Iterable[str],
-    optional_features: Optional[Mapping[str, float]] = None,
+    optional_features: Optional[OptionalFeatures] = None,
 ) -> FeatureMatchResult:
-    vendor_norm = {normalize_feature_token(feat) for feat in vendor_features}
-    required_norm = [normalize_feature_token(feat) for feat in must_haves]
+    vendor_norm = frozenset(normalize_feature_token(feat) for feat in vendor_features)
+    # Ordered dedupe: matched/missing lists must follow the request's order.
+    required_norm = dict.fromkeys(normalize_feature_token(feat) for feat in must_haves)
+    missing_set = required_norm.keys() - vendor_norm
 
-    matched: List[str] = []
-    missing: List[str] = []
-
-    for feature in required_norm:
-        if feature in vendor_norm:
-            matched.append(feature)
-        else:
-            missing.append(feature)
+    matched = [feature for feature in required_norm if feature not in missing_set]
+    missing = [feature for feature in required_norm if feature in missing_set]
 
     total_required = len(required_norm)
     if total_required == 0:
@@ -118,13 +187,11 @@ def compute_feature_score(
 
     optional_score = 1.0
     if optional_features:
-        total_weight = sum(optional_features.values())
+        if isinstance(optional_features, Mapping):
+            optional_features = prepare_optional_features(optional_features)
+        total_weight = sum(weight for _, weight in optional_features)
         if total_weight > 0:
-            achieved = sum(
-                optional_features[key]
-                for key in optional_features
-                if normalize_feature_token(key) in vendor_norm
-            )
+            achieved = sum(weight for key, weight in optional_features if key in vendor_norm)
             optional_score = achieved / total_weight
         else:
             optional_score = 0.0
@@ -137,7 +204,7 @@ def compute_feature_score(
     else:
         score = optional_score
 
-    score = float(max(0.0, min(score, 1.0)))
+    score = _clamp01(score)
     return FeatureMatchResult(score=score, matched=matched, missing=missing)
 
 
@@ -151,8 +218,10 @@ COMPLIANCE_WEIGHTS: Dict[str, float] = {
     "none": 0.0,
 }
 
+_VERIFIED_EVIDENCE = frozenset({"certified", "attested_with_report"})
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class ComplianceFrameworkStatus:
     framework: str
     evidence: str
@@ -160,7 +229,7 @@ class ComplianceFrameworkStatus:
     verified: bool
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ComplianceScore:
     score: float
     frameworks: List[ComplianceFrameworkStatus]
@@ -173,25 +242,26 @@ def compute_compliance_score(
     mandatory_threshold: float = 0.8,
 ) -> ComplianceScore:
     frameworks: List[ComplianceFrameworkStatus] = []
-    scores: List[float] = []
+    weight_of = COMPLIANCE_WEIGHTS.get
+    evidence_of = vendor_evidence.get
+    total = 0.0
     blocking = False
     for framework in required:
-        key = framework.lower()
-        evidence = vendor_evidence.get(key, "none")
-        score = COMPLIANCE_WEIGHTS.get(evidence, 0.0)
+        evidence = evidence_of(framework.lower(), "none")
+        score = weight_of(evidence, 0.0)
         frameworks.append(
             ComplianceFrameworkStatus(
                 framework=framework,
                 evidence=evidence,
                 score=score,
-                verified=evidence in {"certified", "attested_with_report"},
+                verified=evidence in _VERIFIED_EVIDENCE,
             )
         )
-        scores.append(score)
+        total += score
         if score < mandatory_threshold:
             blocking = True
 
-    overall = sum(scores) / len(scores) if scores else 1.0
+    overall = total / len(frameworks) if frameworks else 1.0
     return ComplianceScore(score=overall, frameworks=frameworks, blocking=blocking)
 
 
@@ -204,14 +274,34 @@ SUPPORT_TIER_SCORES = {
 }
 
 
-def compute_sla_score(sla_percentage: float, support_tier: Optional[str]) -> float:
-    sla_score = min(1.0, max(0.0, sla_percentage / 100.0))
+def compute_sla_score(
+    sla_percentage: float,
+    support_tier: Optional[str],
+) -> float:
+    sla_score = _clamp01(sla_percentage / 100.0)
     tier_score = SUPPORT_TIER_SCORES.get((support_tier or "").lower(), 0.5)
     combined = 0.7 * sla_score + 0.3 * tier_score
-    return float(max(0.0, min(combined, 1.0)))
+    return _clamp01(combined)
+
+
+def compute_sla_score_batch(
+    sla_percentages: Sequence[float],
+    support_tiers: Sequence[Optional[str]],
+) -> List[float]:
+    """Vectorised :func:`compute_sla_score` over parallel vendor sequences."""
+    if np is None:
+        return [compute_sla_score(pct, tier) for pct, tier in zip(sla_percentages, support_tiers)]
+    sla = np.clip(np.asarray(sla_percentages, dtype=float) / 100.0, 0.0, 1.0)
+    tier_score = SUPPORT_TIER_SCORES.get
+    tiers = np.fromiter(
+        (tier_score((tier or "").lower(), 0.5) for tier in support_tiers),
+        dtype=float,
+        count=len(support_tiers),
+    )
+    return np.clip(0.7 * sla + 0.3 * tiers, 0.0, 1.0).tolist()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class UtilityBreakdown:
     cost_fit: float
     feature_score: float
@@ -254,7 +344,7 @@ def compute_buyer_utility(
         + weights["compliance"] * compliance_score
         + weights["sla"] * sla_score
     )
-    buyer_utility = float(max(0.0, min(buyer_utility, 1.0)))
+    buyer_utility = _clamp01(buyer_utility)
 
     return UtilityBreakdown(
         cost_fit=float(cost_fit),
@@ -265,7 +355,50 @@ def compute_buyer_utility(
     )
 
 
-@dataclass(frozen=True)
+def compute_buyer_utility_batch(
+    *,
+    unit_prices: Sequence[float],
+    budget_per_unit: float,
+    feature_scores: Sequence[float],
+    compliance_scores: Sequence[float],
+    sla_scores: Sequence[float],
+    weights: Optional[Dict[str, float]] = None,
+) -> List[float]:
+    """Buyer utility for many vendors at once against a single budget.
+
+    Returns only the utilities; build a full :class:`UtilityBreakdown` with
+    :func:`compute_buyer_utility` for the vendors that need explaining.
+    """
+    weights = weights or {"cost": 0.40, "features": 0.35, "compliance": 0.15, "sla": 0.10}
+    if np is None:
+        return [
+            compute_buyer_utility(
+                unit_price=price,
+                budget_per_unit=budget_per_unit,
+                feature_score=feature,
+                compliance_score=compliance,
+                sla_score=sla,
+                weights=weights,
+            ).buyer_utility
+            for price, feature, compliance, sla in zip(unit_prices, feature_scores, compliance_scores, sla_scores)
+        ]
+
+    budget = max(budget_per_unit, 0.0)
+    price = np.maximum(np.asarray(unit_prices, dtype=float), 0.0)
+    if budget <= 0:
+        cost_fit = np.zeros_like(price)
+    else:
+        cost_fit = np.where(price <= budget, 1.0, np.maximum(0.0, 1.0 - (price - budget) / (3 * budget)))
+    utility = (
+        weights["cost"] * cost_fit
+        + weights["features"] * np.asarray(feature_scores, dtype=float)
+        + weights["compliance"] * np.asarray(compliance_scores, dtype=float)
+        + weights["sla"] * np.asarray(sla_scores, dtype=float)
+    )
+    return np.clip(utility, 0.0, 1.0).tolist()
+
+
+@dataclass(frozen=True, slots=True)
 class SellerUtility:
     seller_margin: float
     seller_utility: float
@@ -280,13 +413,39 @@ def compute_seller_utility(
     margin_weight: float = 0.9,
 ) -> SellerUtility:
     price_span = max(list_price - floor_price, 0.01)
-    margin = max(0.0, min((proposed_price - floor_price) / price_span, 1.0))
-    seller_utility = max(0.0, min(margin_weight * margin + (1 - margin_weight) * 0.5, 1.0))
+    margin = _clamp01((proposed_price - floor_price) / price_span)
+    seller_utility = _clamp01(margin_weight * margin + (1 - margin_weight) * 0.5)
     if seller_utility < min_accept_threshold:
         seller_utility = min_accept_threshold
     return SellerUtility(seller_margin=float(margin), seller_utility=float(seller_utility))
 
 
+def compute_seller_utility_sweep(
+    proposed_prices: Sequence[float],
+    *,
+    list_price: float,
+    floor_price: float,
+    min_accept_threshold: float = 0.1,
+    margin_weight: float = 0.9,
+) -> List[float]:
+    """Seller utility for a sweep of candidate prices against one price band."""
+    if np is None:
+        return [
+            compute_seller_utility(
+                proposed_price=price,
+                list_price=list_price,
+                floor_price=floor_price,
+                min_accept_threshold=min_accept_threshold,
+                margin_weight=margin_weight,
+            ).seller_utility
+            for price in proposed_prices
+        ]
+    price_span = max(list_price - floor_price, 0.01)
+    margin = np.clip((np.asarray(proposed_prices, dtype=float) - floor_price) / price_span, 0.0, 1.0)
+    utility = np.clip(margin_weight * margin + (1 - margin_weight) * 0.5, 0.0, 1.0)
+    return np.maximum(utility, min_accept_threshold).tolist()
+
+
 def detect_zopa(
     *,
     buyer_budget_per_unit: float,
@@ -1,6 +1,11 @@
 from __future__ import annotations
 
-from typing import Dict, List
+from typing import Dict, List, Sequence
+
+try:  # pragma: no cover - optional dependency
+    import numpy as np  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency
+    np = None  # type: ignore[assignment]
 
 from ..models import Offer, OfferScore
 
@@ -8,25 +13,32 @@ from ..models import Offer, OfferScore
 class ExplainabilityService:
     """Produces structured summaries for approvals and audit."""
 
+    _COVERAGE_TMPL = "Feature coverage {coverage:.0%} of required capabilities"
+    _MISSING_TMPL = " — missing {missing}"
+    _GAP_TMPL = " (gap {gap}% remaining)"
+    _COST_UNDER_TMPL = "Cost {under:.0%} under budget"
+    _COST_OVER_TMPL = "Cost exceeds budget by {over:.0%}"
+    _RISK_TMPL = "Compliance/risk headroom {headroom:.0%}"
+
     def build_why_this_pick(self, offer: Offer, sensitivity: Dict[str, float]) -> Dict[str, List[str]]:
         components = offer.score
         coverage = components.spec_match
-        coverage_bullet = f"Feature coverage {coverage:.0%} of required capabilities"
+        coverage_bullet = self._COVERAGE_TMPL.format(coverage=coverage)
         if coverage < 1.0:
             missing = [feat.replace("_", " ") for feat in components.missing_features]
             if missing:
-                coverage_bullet += f" — missing {', '.join(missing)}"
+                coverage_bullet += self._MISSING_TMPL.format(missing=", ".join(missing))
             else:
-                coverage_bullet += f" (gap {int(round((1 - coverage) * 100))}% remaining)"
+                coverage_bullet += self._GAP_TMPL.format(gap=int(round((1 - coverage) * 100)))
 
         cost_ratio = components.tco
         if cost_ratio <= 1.0:
-            cost_bullet = f"Cost {(1 - cost_ratio):.0%} under budget"
+            cost_bullet = self._COST_UNDER_TMPL.format(under=1 - cost_ratio)
         else:
-            cost_bullet = f"Cost exceeds budget by {(cost_ratio - 1):.0%}"
+            cost_bullet = self._COST_OVER_TMPL.format(over=cost_ratio - 1)
 
         risk_headroom = max(0.0, 1 - components.risk)
-        risk_bullet = f"Compliance/risk headroom {risk_headroom:.0%}"
+        risk_bullet = self._RISK_TMPL.format(headroom=risk_headroom)
 
         bullets = [coverage_bullet, cost_bullet, risk_bullet]
         return {
@@ -36,6 +48,8 @@ class ExplainabilityService:
         }
 
     def bundle_summary(self, bundles: Dict[str, Offer], sensitivities: Dict[str, Dict[str, float]]) -> Dict[str, Dict[str, List[str]]]:
+        # Pure CPU work under the GIL over a handful of bundles; a thread pool
+        # would only add overhead unless the builder starts doing I/O.
         return {
             bundle_name: self.build_why_this_pick(offer, sensitivities[bundle_name])
             for bundle_name, offer in bundles.items()
@@ -49,3 +63,30 @@ class ExplainabilityService:
             "time": round(weights["time"] * score.time, 4),
             "utility": score.utility,
         }
+
+    def trace_score_components_batch(
+        self,
+        scores: Sequence[OfferScore],
+        weights: Dict[str, float],
+    ) -> Dict[str, List[float]]:
+        """Column-oriented :meth:`trace_score_components` for many offers.
+
+        Returns one list per component (``spec``, ``cost``, ``risk``, ``time``,
+        ``utility``), aligned with ``scores``.
+        """
+        if np is None:
+            traces = [self.trace_score_components(score, weights) for score in scores]
+            return {key: [trace[key] for trace in traces] for key in ("spec", "cost", "risk", "time", "utility")}
+        matrix = np.array(
+            [(score.spec_match, score.tco, score.risk, score.time) for score in scores],
+            dtype=float,
+        ).reshape(-1, 4)
+        weight_vector = np.array([weights["value"], weights["cost"], weights["risk"], weights["time"]])
+        weighted = np.round(matrix * weight_vector, 4)
+        return {
+            "spec": weighted[:, 0].tolist(),
+            "cost": weighted[:, 1].tolist(),
+            "risk": weighted[:, 2].tolist(),
+            "time": weighted[:, 3].tolist(),
+            "utility": [score.utility for score in scores],
+        }
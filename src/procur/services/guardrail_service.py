@@ -1,11 +1,21 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import List
+from typing import Dict, List, Sequence, Tuple
+
+try:  # pragma: no cover - optional dependency
+    import numpy as np  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency
+    np = None  # type: ignore[assignment]
 
 from ..models import OfferComponents, PaymentTerms, VendorProfile
 
 
+def _int_keyed_tiers(price_tiers: Dict[str, float]) -> Dict[int, float]:
+    # Only canonical integer keys ("100", not "0100" or "pro") can match str(quantity).
+    return {int(key): price for key, price in price_tiers.items() if key.isdigit() and str(int(key)) == key}
+
+
 @dataclass
 class GuardrailAlert:
     code: str
@@ -19,20 +29,31 @@ class GuardrailService:
     def __init__(self, price_outlier_threshold: float = 0.3, *, run_mode: str = "production") -> None:
         self.price_outlier_threshold = price_outlier_threshold
         self.run_mode = run_mode
+        self._verify_cache: Dict[Tuple[str, str], Tuple[GuardrailAlert, ...]] = {}
 
     def verify_counterparty(self, vendor: VendorProfile) -> List[GuardrailAlert]:
-        alerts: List[GuardrailAlert] = []
-        if self.run_mode == "simulation":
-            return alerts
-        if "bank_account" not in vendor.contact_endpoints:
-            alerts.append(
-                GuardrailAlert(
-                    code="missing_bank_verification",
-                    message="Vendor bank verification pending",
-                    blocking=False,
+        """Check counterparty verification, memoised per vendor and run mode.
+
+        Vendor profiles are treated as stable for the lifetime of the service;
+        call :meth:`clear_verification_cache` after a profile changes.
+        """
+        key = (vendor.vendor_id, self.run_mode)
+        cached = self._verify_cache.get(key)
+        if cached is None:
+            alerts: List[GuardrailAlert] = []
+            if self.run_mode != "simulation" and "bank_account" not in vendor.contact_endpoints:
+                alerts.append(
+                    GuardrailAlert(
+                        code="missing_bank_verification",
+                        message="Vendor bank verification pending",
+                        blocking=False,
+                    )
                 )
-            )
-        return alerts
+            cached = self._verify_cache[key] = tuple(alerts)
+        return list(cached)
+
+    def clear_verification_cache(self) -> None:
+        self._verify_cache.clear()
 
     def detect_price_outlier(
         self,
@@ -40,8 +61,7 @@ class GuardrailService:
         offer: OfferComponents,
     ) -> List[GuardrailAlert]:
         alerts: List[GuardrailAlert] = []
-        tier_key = str(offer.quantity)
-        historical = vendor.price_tiers.get(tier_key)
+        historical = _int_keyed_tiers(vendor.price_tiers).get(offer.quantity)
         if historical is None:
             return alerts
         deviation = abs(offer.unit_price - historical) / max(historical, 1.0)
@@ -55,6 +75,32 @@ class GuardrailService:
             )
         return alerts
 
+    def detect_price_outliers_batch(
+        self,
+        vendor: VendorProfile,
+        offers: Sequence[OfferComponents],
+    ) -> List[List[GuardrailAlert]]:
+        """Run :meth:`detect_price_outlier` for many offers against one vendor."""
+        if np is None:
+            return [self.detect_price_outlier(vendor, offer) for offer in offers]
+        tier_get = _int_keyed_tiers(vendor.price_tiers).get
+        tiers = [tier_get(offer.quantity) for offer in offers]
+        historical = np.array([np.nan if tier is None else tier for tier in tiers], dtype=float)
+        prices = np.fromiter((offer.unit_price for offer in offers), dtype=float, count=len(offers))
+        deviations = np.abs(prices - historical) / np.maximum(historical, 1.0)
+        flagged = np.flatnonzero(deviations > self.price_outlier_threshold)  # NaN never compares greater
+
+        results: List[List[GuardrailAlert]] = [[] for _ in offers]
+        for index in flagged.tolist():
+            results[index].append(
+                GuardrailAlert(
+                    code="price_outlier",
+                    message=f"Offer price deviates {float(deviations[index]):.2%} from tier {tiers[index]}",
+                    blocking=False,
+                )
+            )
+        return results
+
     def vet_offer(self, vendor: VendorProfile, offer: OfferComponents) -> List[GuardrailAlert]:
         alerts = self.verify_counterparty(vendor)
         alerts.extend(self.detect_price_outlier(vendor, offer))
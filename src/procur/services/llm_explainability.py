@@ -2,23 +2,34 @@
 
 from __future__ import annotations
 
-import json
-from dataclasses import asdict, dataclass
-from datetime import datetime
-from typing import Any, Dict, List, Optional
+import asyncio
+import logging
+import math
+import os
+import re
+from collections import Counter, OrderedDict, deque
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from operator import attrgetter
+from typing import Any, Deque, Dict, List, Optional, Sequence, Tuple
+
+from pydantic import TypeAdapter
+from pydantic_core import from_json, to_json, to_jsonable_python
 
 from ..llm import LLMClient
 from ..models import Offer, Request, VendorProfile
 
+logger = logging.getLogger(__name__)
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class RationaleFact:
     """A single fact-to-implication pair in the explanation."""
     fact: str
     implication: str
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PolicyEvent:
     """A policy or guardrail enforcement event."""
     policy_id: str
@@ -26,7 +37,7 @@ class PolicyEvent:
     note: str
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class NumericSnapshot:
     """Canonical numeric facts for audits and charts."""
     latest_unit_price: float
@@ -36,7 +47,7 @@ class NumericSnapshot:
     acceptance_probability: float
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RecommendedAction:
     """A suggested next action with priority and type."""
     priority: int
@@ -44,14 +55,14 @@ class RecommendedAction:
     text: str
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ExplainabilityTrace:
     """Internal trace for debugging and engineering."""
     step: str
     detail: str
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ExplanationRecord:
     """
     Complete explanation record (v1) for a negotiation state.
@@ -70,7 +81,21 @@ class ExplanationRecord:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
-        return asdict(self)
+        return to_jsonable_python(self)
+
+    def to_json(self) -> bytes:
+        """Encode straight to JSON without building the intermediate dict tree."""
+        return to_json(self)
+
+
+_RECORD_ADAPTER = TypeAdapter(ExplanationRecord)
+_RESPONSE_FORMAT: Dict[str, Any] = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "ExplanationRecord",
+        "schema": _RECORD_ADAPTER.json_schema(),
+    },
+}
 
 
 # System prompt for the LLM explainability agent
@@ -230,6 +255,144 @@ Output: {
 """
 
 
+# The system prompt and few-shot examples never change, so they form one static
+# system message ahead of the per-call payload. Providers with prefix caching
+# (automatic on OpenAI-compatible endpoints) then serve that prefix from cache.
+_SYSTEM_MESSAGE: Dict[str, str] = {
+    "role": "system",
+    "content": f"{EXPLAINABILITY_SYSTEM_PROMPT}\nHere are some examples to guide your response:\n{FEW_SHOT_EXAMPLES}",
+}
+
+_BARE_SYSTEM_MESSAGE: Dict[str, str] = {"role": "system", "content": EXPLAINABILITY_SYSTEM_PROMPT}
+
+# Individual few-shot examples with the bag of words used to match them to a payload.
+_EXAMPLES: Tuple[str, ...] = tuple(
+    "# Example" + chunk for chunk in FEW_SHOT_EXAMPLES.split("\n# Example")[1:]
+)
+_WORD = re.compile(r"[a-z_]+")
+
+
+def _words(text: str) -> Counter:
+    return Counter(_WORD.findall(text.lower()))
+
+
+_EXAMPLE_WORDS: Tuple[Counter, ...] = tuple(
+    _words(example.split("Output:")[0]) for example in _EXAMPLES
+)
+
+
+def _select_examples(payload: Dict[str, Any], k: int) -> List[str]:
+    """Pick the ``k`` few-shot examples whose inputs share the most vocabulary with the payload."""
+    signature = _words(
+        " ".join(
+            [
+                str(payload["decision"]),
+                *map(str, payload.get("policy_events") or ()),
+                *map(str, payload.get("opponent_model") or ()),
+            ]
+        )
+    )
+    norm = math.sqrt(sum(count * count for count in signature.values())) or 1.0
+
+    def similarity(index: int) -> float:
+        words = _EXAMPLE_WORDS[index]
+        dot = sum(count * words[word] for word, count in signature.items())
+        return dot / (norm * math.sqrt(sum(c * c for c in words.values())))
+
+    ranked = sorted(range(len(_EXAMPLES)), key=similarity, reverse=True)
+    return [_EXAMPLES[index] for index in sorted(ranked[:k])]
+
+
+# What a failed LLM round-trip can raise: transport errors surface from
+# LLMClient.complete as RuntimeError, malformed answers as ValueError
+# (including JSONDecodeError), KeyError or TypeError. Anything else is a bug
+# and propagates.
+_LLM_ERRORS = (RuntimeError, ValueError, KeyError, TypeError)
+
+_FALLBACK_SUMMARY = "Round {round}: Current offer at ${unit_price:.2f}/unit. Engine decision: {decision}."
+_FALLBACK_DETAIL = (
+    "Negotiation round {round} summary:\n"
+    "- Current unit price: ${unit_price:.2f}\n"
+    "- Budget per unit: ${budget_per_unit:.2f}\n"
+    "- Engine decision: {decision}\n"
+    "- Policy events: {policy_events} recorded\n\n"
+    "Note: Full LLM explanation unavailable due to error: {error}\n"
+    "This is a deterministic fallback summary."
+)
+
+# Output-length budgeting: completions needed before the p99 budget kicks in,
+# and a stop sequence so the model does not ramble past the JSON. A code-fence
+# stop is deliberately absent because answers often open with one.
+_OUTPUT_WARMUP = 32
+_STOP_SEQUENCES = ["\n\n\n"]
+
+# Batched explanations: payloads share one prompt, answers come back as "[i] {...}".
+MAX_EXPLAIN_BATCH = 16
+_BATCH_MARKER = re.compile(r"^\s*\[(\d+)\]\s*", re.MULTILINE)
+
+
+ENGINE_VERSION = "1.0"
+
+# Only the most recent offers carry signal for the narrative.
+HISTORY_WINDOW = 4
+
+_EMPTY = (None, {}, [], "")
+
+_HISTORY_NUMBERS = attrgetter("components.unit_price", "components.term_months", "score.utility")
+
+
+def _history_entry(offer: Offer) -> Dict[str, Any]:
+    unit_price, term_months, utility = _HISTORY_NUMBERS(offer)
+    # Offer carries neither field today; callers may pass richer offer objects.
+    timestamp = getattr(offer, "timestamp", None)
+    from_buyer = getattr(offer, "from_buyer", None)
+    return {
+        "timestamp": timestamp.isoformat() if timestamp is not None else None,
+        "actor": None if from_buyer is None else ("buyer" if from_buyer else "seller"),
+        "unit_price": unit_price,
+        "term_months": term_months,
+        "utility": utility,
+    }
+
+
+def _prune(value: Any) -> Any:
+    if isinstance(value, dict):
+        pruned = {key: _prune(item) for key, item in value.items()}
+        return {key: item for key, item in pruned.items() if item not in _EMPTY}
+    if isinstance(value, list):
+        return [_prune(item) for item in value]
+    return value
+
+
+def _compact_payload(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Prompt-only view of a payload: empty fields and unreferenced vendor detail dropped.
+
+    The full payload is still what validation and fallbacks read.
+    """
+    compact = _prune(payload)
+    vendor = compact.get("vendor")
+    if vendor:
+        events = " ".join(str(event) for event in payload.get("policy_events") or ()).lower()
+        if "tier" not in events:
+            vendor.pop("price_tiers", None)
+        if "capabilit" not in events and "feature" not in events:
+            vendor.pop("capability_tags", None)
+    return compact
+
+
+def _encode_payload(payload: Dict[str, Any]) -> str:
+    return to_json(_compact_payload(payload)).decode()
+
+
+def _extract_json(content: str) -> str:
+    """Cut the outermost JSON object out of an LLM answer, skipping code fences or prose."""
+    start = content.find("{")
+    end = content.rfind("}")
+    if start == -1 or end < start:
+        return content
+    return content[start:end + 1]
+
+
 class LLMExplainabilityService:
     """
     LLM-powered explainability service for negotiation transparency.
@@ -238,10 +401,90 @@ class LLMExplainabilityService:
     audit trails, and actionable recommendations using an LLM.
     """
 
-    def __init__(self, llm_client: Optional[LLMClient] = None):
-        """Initialize the explainability service with an LLM client."""
+    def __init__(
+        self,
+        llm_client: Optional[LLMClient] = None,
+        *,
+        cache_size: int = 4096,
+        max_output_tokens: int = 1500,
+        structured_output: bool = False,
+        few_shot_k: Optional[int] = None,
+    ):
+        """Initialize the explainability service with an LLM client.
+
+        Validated explanations are kept in an LRU cache of ``cache_size``
+        entries keyed on the parts of the payload that drive the narrative
+        (request, vendor, round, price to the cent, decision and policy
+        events), so near-identical states skip the LLM call. Pass
+        ``cache_size=0`` to disable it.
+
+        ``max_output_tokens`` caps each explanation. Once enough completions
+        have been observed, the per-call budget shrinks to 1.1x their p99.
+
+        ``structured_output`` asks the provider to constrain single-state
+        answers to the ExplanationRecord JSON schema (OpenAI-style
+        ``response_format``). Enable it only for endpoints that support it.
+
+        ``few_shot_k`` sends only the ``k`` few-shot examples closest to each
+        single-state payload (by word overlap with its decision, policy events
+        and opponent model), in the user turn. That trims prompt tokens but the
+        examples then fall outside the cacheable system prefix, so it pays off
+        mainly on endpoints without prefix caching. ``None`` sends all of them.
+        """
         self.llm_client = llm_client or LLMClient()
         self.explanation_version = "1.0"
+        self.cache_size = cache_size
+        self.max_output_tokens = max_output_tokens
+        self.structured_output = structured_output
+        self.few_shot_k = few_shot_k
+        self._cache: OrderedDict[Tuple[Any, ...], ExplanationRecord] = OrderedDict()
+        self._output_lengths: Deque[float] = deque(maxlen=256)
+
+    def _output_budget(self) -> int:
+        if len(self._output_lengths) < _OUTPUT_WARMUP:
+            return self.max_output_tokens
+        observed = sorted(self._output_lengths)
+        p99 = observed[math.ceil(0.99 * len(observed)) - 1]
+        return min(self.max_output_tokens, int(p99 * 1.1) + 1)
+
+    def _response_options(self) -> Dict[str, Any]:
+        if self.structured_output:
+            return {"response_format": _RESPONSE_FORMAT}
+        return {"stop": _STOP_SEQUENCES}
+
+    def _observe_output(self, response: Dict[str, Any], items: int = 1) -> None:
+        completion_tokens = (response.get("usage") or {}).get("completion_tokens")
+        if completion_tokens:
+            self._output_lengths.append(completion_tokens / items)
+
+    @staticmethod
+    def _cache_key(payload: Dict[str, Any]) -> Tuple[Any, ...]:
+        unit_price = payload["latest_offer"]["components"]["unit_price"]
+        return (
+            payload["request"]["id"],
+            payload["vendor"]["id"],
+            payload["metadata"]["round"],
+            round(unit_price, 2) if unit_price is not None else None,
+            payload["decision"],
+            tuple(str(event) for event in payload["policy_events"]),
+        )
+
+    def _cached(self, key: Tuple[Any, ...]) -> Optional[ExplanationRecord]:
+        record = self._cache.get(key)
+        if record is not None:
+            self._cache.move_to_end(key)
+        return record
+
+    def _remember(self, key: Tuple[Any, ...], record: ExplanationRecord) -> None:
+        if self.cache_size <= 0:
+            return
+        self._cache[key] = record
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    def clear_cache(self) -> None:
+        self._cache.clear()
 
     def build_payload(
         self,
@@ -258,6 +501,7 @@ class LLMExplainabilityService:
         competing_offers: Optional[List[Dict[str, Any]]] = None,
         concession_notes: Optional[List[str]] = None,
         derived_metrics: Optional[Dict[str, float]] = None,
+        include_timestamp: bool = False,
     ) -> Dict[str, Any]:
         """
         Build the compact JSON payload to send to the LLM.
@@ -266,7 +510,7 @@ class LLMExplainabilityService:
             request: The procurement request
             vendor: The vendor being negotiated with
             latest_offer: The most recent offer
-            history: Last N offers (3-6 recommended)
+            history: Last N offers (only the last 4 are sent)
             round_number: Current negotiation round
             decision: Engine decision (ACCEPT/COUNTER/DROP/etc)
             acceptance_probability: Computed acceptance probability
@@ -276,6 +520,7 @@ class LLMExplainabilityService:
             competing_offers: List of competing vendor offers
             concession_notes: Engine-appended concession notes
             derived_metrics: Pre-computed metrics
+            include_timestamp: Stamp the payload metadata (second precision, UTC) for audit copies
 
         Returns:
             Compact JSON payload for LLM
@@ -301,7 +546,7 @@ class LLMExplainabilityService:
             "price_tiers": vendor.price_tiers,
             "guardrails": {
                 "price_floor": vendor.guardrails.price_floor if vendor.guardrails else None,
-                "price_ceiling": vendor.guardrails.price_ceiling if vendor.guardrails else None,
+                "price_ceiling": getattr(vendor.guardrails, "price_ceiling", None),
             },
             "capability_tags": vendor.capability_tags,
             "certifications": vendor.certifications,
@@ -320,28 +565,23 @@ class LLMExplainabilityService:
             "score": {
                 "utility": latest_offer.score.utility,
                 "risk": latest_offer.score.risk,
-                "tco": latest_offer.score.tco if hasattr(latest_offer.score, 'tco') else None,
+                "tco": latest_offer.score.tco,
             },
         }
 
-        # Build history (last 3-6 offers)
-        history_data = []
-        for offer in history[-6:]:
-            history_data.append({
-                "timestamp": offer.timestamp.isoformat() if hasattr(offer, 'timestamp') else None,
-                "actor": "buyer" if offer.from_buyer else "seller",
-                "unit_price": offer.components.unit_price,
-                "term_months": offer.components.term_months,
-                "utility": offer.score.utility,
-            })
+        # Build history (last 4 offers)
+        history_data = [_history_entry(offer) for offer in history[-HISTORY_WINDOW:]]
+
+        metadata: Dict[str, Any] = {
+            "engine_version": ENGINE_VERSION,
+            "explanation_version": self.explanation_version,
+            "round": round_number,
+        }
+        if include_timestamp:
+            metadata["timestamp"] = datetime.now(timezone.utc).isoformat(timespec="seconds")
 
         payload = {
-            "metadata": {
-                "engine_version": "1.0",
-                "explanation_version": self.explanation_version,
-                "timestamp": datetime.utcnow().isoformat(),
-                "round": round_number,
-            },
+            "metadata": metadata,
             "request": request_data,
             "vendor": vendor_data,
             "latest_offer": offer_data,
@@ -402,53 +642,196 @@ class LLMExplainabilityService:
             **kwargs
         )
 
+        return self._explain_payload(payload)
+
+    def explain_states_batch(
+        self,
+        states: Sequence[Dict[str, Any]],
+        *,
+        max_batch_size: int = MAX_EXPLAIN_BATCH,
+    ) -> List[ExplanationRecord]:
+        """
+        Explain several negotiation states, packing them into shared LLM calls.
+
+        Each entry in ``states`` holds the keyword arguments of
+        :meth:`explain_state`. Up to ``max_batch_size`` payloads share one
+        prompt, so the system prompt and few-shot examples are sent once per
+        batch instead of once per state. Any item whose answer cannot be parsed
+        is retried on its own through :meth:`explain_state`'s path.
+
+        Args:
+            states: Keyword arguments for each state to explain
+            max_batch_size: Payloads per LLM call (capped at 16; larger batches degrade accuracy)
+
+        Returns:
+            One ExplanationRecord per state, in input order
+        """
+        payloads = [self.build_payload(**state) for state in states]
+        records: List[Optional[ExplanationRecord]] = [
+            self._cached(self._cache_key(payload)) for payload in payloads
+        ]
+        pending = [index for index, record in enumerate(records) if record is None]
+
+        size = max(1, min(max_batch_size, MAX_EXPLAIN_BATCH))
+        for start in range(0, len(pending), size):
+            indices = pending[start:start + size]
+            chunk = [payloads[index] for index in indices]
+            if len(chunk) == 1:
+                explained = [self._explain_payload(chunk[0])]
+            else:
+                explained = self._explain_payload_batch(chunk)
+            for index, record in zip(indices, explained):
+                records[index] = record
+        return records  # type: ignore[return-value]
+
+    async def explain_state_async(self, **state: Any) -> ExplanationRecord:
+        """Async :meth:`explain_state`: awaits the LLM instead of blocking the event loop.
+
+        Takes the same keyword arguments as :meth:`explain_state`.
+        """
+        payload = self.build_payload(**state)
+        key = self._cache_key(payload)
+        cached = self._cached(key)
+        if cached is not None:
+            return cached
+
+        options = self._single_call(payload)
+        try:
+            acomplete = getattr(self.llm_client, "acomplete", None)
+            if acomplete is not None:
+                response = await acomplete(**options)
+            else:
+                response = await asyncio.to_thread(self.llm_client.complete, **options)
+            return self._accept_response(response, payload, key)
+        except _LLM_ERRORS as e:
+            logger.warning("LLM explanation failed; using fallback", exc_info=True)
+            return self._fallback_explanation(payload=payload, error=str(e))
+
+    async def explain_many_async(
+        self,
+        states: Sequence[Dict[str, Any]],
+        *,
+        concurrency: Optional[int] = None,
+    ) -> List[ExplanationRecord]:
+        """
+        Explain several negotiation states concurrently.
+
+        Args:
+            states: Keyword arguments for each state to explain
+            concurrency: In-flight LLM calls (defaults to $EXPLAIN_CONCURRENCY, else 8)
+
+        Returns:
+            One ExplanationRecord per state, in input order
+        """
+        limit = concurrency or int(os.environ.get("EXPLAIN_CONCURRENCY", 8))
+        semaphore = asyncio.Semaphore(max(1, limit))
+
+        async def run(state: Dict[str, Any]) -> ExplanationRecord:
+            async with semaphore:
+                return await self.explain_state_async(**state)
+
+        return list(await asyncio.gather(*(run(state) for state in states)))
+
+    def _single_call(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        system_message, examples = _SYSTEM_MESSAGE, ""
+        if self.few_shot_k is not None:
+            chosen = _select_examples(payload, self.few_shot_k)
+            system_message = _BARE_SYSTEM_MESSAGE
+            examples = "Here are some examples to guide your response:\n" + "\n".join(chosen) + "\n"
+
         # Create user prompt with payload
         user_prompt = f"""Given the negotiation payload below, produce an ExplanationRecord v1 JSON.
 Make 'short_summary' first, then 'detailed_explanation', then other fields.
 Use clear bullets in 'detailed_explanation' and include 3 prioritized 'recommended_actions'.
 
-Here are some examples to guide your response:
-{FEW_SHOT_EXAMPLES}
-
-Now, analyze this negotiation payload:
-{json.dumps(payload, indent=2)}
+{examples}Now, analyze this negotiation payload:
+{_encode_payload(payload)}
 
 Respond with valid JSON matching the ExplanationRecord schema."""
 
-        # Call LLM
-        try:
-            response = self.llm_client.complete(
-                messages=[
-                    {"role": "system", "content": EXPLAINABILITY_SYSTEM_PROMPT},
-                    {"role": "user", "content": user_prompt}
-                ],
-                temperature=0.2,  # Low temperature for consistency
-                max_tokens=1500,
-            )
+        return {
+            "messages": [system_message, {"role": "user", "content": user_prompt}],
+            "temperature": 0.0,  # Greedy decoding: schema-bound output, repeatable answers
+            "max_tokens": self._output_budget(),
+            **self._response_options(),
+        }
 
-            # Parse JSON response
-            content = response["content"]
+    def _accept_response(
+        self,
+        response: Dict[str, Any],
+        payload: Dict[str, Any],
+        key: Tuple[Any, ...],
+    ) -> ExplanationRecord:
+        self._observe_output(response)
 
-            # Extract JSON from markdown code blocks if present
-            if "```json" in content:
-                content = content.split("```json")[1].split("```")[0].strip()
-            elif "```" in content:
-                content = content.split("```")[1].split("```")[0].strip()
+        content = response["content"]
+        if not content or not content.strip():
+            # Reasoning models return no content when cut off by max_tokens.
+            raise ValueError("LLM returned an empty explanation")
+        parsed = from_json(content if self.structured_output else _extract_json(content))
 
-            parsed = json.loads(content)
+        # Validate and convert to ExplanationRecord
+        explanation = self._validate_and_convert(parsed, payload)
+        self._remember(key, explanation)
+        return explanation
 
-            # Validate and convert to ExplanationRecord
-            explanation = self._validate_and_convert(parsed, payload)
+    def _explain_payload(self, payload: Dict[str, Any]) -> ExplanationRecord:
+        key = self._cache_key(payload)
+        cached = self._cached(key)
+        if cached is not None:
+            return cached
 
-            return explanation
+        # Call LLM
+        try:
+            response = self.llm_client.complete(**self._single_call(payload))
+            return self._accept_response(response, payload, key)
 
-        except Exception as e:
+        except _LLM_ERRORS as e:
             # Return fallback explanation on LLM failure
+            logger.warning("LLM explanation failed; using fallback", exc_info=True)
             return self._fallback_explanation(
                 payload=payload,
                 error=str(e),
             )
 
+    def _explain_payload_batch(self, payloads: List[Dict[str, Any]]) -> List[ExplanationRecord]:
+        numbered = "\n".join(
+            f"[{index}]\n{_encode_payload(payload)}" for index, payload in enumerate(payloads, start=1)
+        )
+        user_prompt = f"""Each numbered negotiation payload below needs its own ExplanationRecord v1 JSON.
+Make 'short_summary' first, then 'detailed_explanation', then other fields.
+Use clear bullets in 'detailed_explanation' and include 3 prioritized 'recommended_actions'.
+
+Now, analyze these {len(payloads)} negotiation payloads:
+{numbered}
+
+Respond with one valid ExplanationRecord JSON per payload, each on its own line prefixed by
+its marker: [1] {{...}} [2] {{...}} and so on."""
+
+        answers: Dict[int, str] = {}
+        try:
+            response = self.llm_client.complete(
+                messages=[_SYSTEM_MESSAGE, {"role": "user", "content": user_prompt}],
+                temperature=0.0,
+                max_tokens=self._output_budget() * len(payloads),
+            )
+            self._observe_output(response, items=len(payloads))
+            parts = _BATCH_MARKER.split(response["content"])
+            answers = {int(marker): body for marker, body in zip(parts[1::2], parts[2::2])}
+        except _LLM_ERRORS:
+            logger.warning("Batched LLM explanation failed; explaining items one by one", exc_info=True)
+
+        records: List[ExplanationRecord] = []
+        for index, payload in enumerate(payloads, start=1):
+            try:
+                parsed = from_json(_extract_json(answers[index]))
+                record = self._validate_and_convert(parsed, payload)
+                self._remember(self._cache_key(payload), record)
+                records.append(record)
+            except _LLM_ERRORS:
+                records.append(self._explain_payload(payload))
+        return records
+
     def _validate_and_convert(
         self,
         parsed: Dict[str, Any],
@@ -458,62 +841,28 @@ Respond with valid JSON matching the ExplanationRecord schema."""
         Validate LLM output and convert to ExplanationRecord.
 
         Args:
-            parsed: Parsed JSON from LLM
+            parsed: Parsed JSON from LLM (numeric snapshots are updated in place)
             payload: Original payload for validation
 
         Returns:
             Validated ExplanationRecord
         """
-        # Validate required fields
-        required_fields = [
-            "explanation_version",
-            "short_summary",
-            "detailed_explanation",
-            "rationale",
-            "policy_summary",
-            "numeric_snapshots",
-            "recommended_actions",
-            "confidence",
-            "explainability_trace"
-        ]
-
-        for field in required_fields:
-            if field not in parsed:
-                raise ValueError(f"Missing required field: {field}")
+        if not isinstance(parsed, dict):
+            raise ValueError("ExplanationRecord must be a JSON object")
 
         # Validate numeric snapshots against payload
-        numeric_snapshots = parsed["numeric_snapshots"]
-        derived_metrics = payload.get("derived_metrics", {})
+        numeric_snapshots = parsed.get("numeric_snapshots")
+        if isinstance(numeric_snapshots, dict):
+            # Prefer engine-provided numbers
+            if "budget_per_unit" in payload["request"] and payload["request"]["budget_per_unit"]:
+                numeric_snapshots["budget_per_unit"] = payload["request"]["budget_per_unit"]
 
-        # Prefer engine-provided numbers
-        if "budget_per_unit" in payload["request"] and payload["request"]["budget_per_unit"]:
-            numeric_snapshots["budget_per_unit"] = payload["request"]["budget_per_unit"]
+            if "latest_unit_price" in payload["latest_offer"]["components"]:
+                numeric_snapshots["latest_unit_price"] = payload["latest_offer"]["components"]["unit_price"]
 
-        if "latest_unit_price" in payload["latest_offer"]["components"]:
-            numeric_snapshots["latest_unit_price"] = payload["latest_offer"]["components"]["unit_price"]
-
-        # Convert to dataclass
-        explanation = ExplanationRecord(
-            explanation_version=parsed["explanation_version"],
-            short_summary=parsed["short_summary"],
-            detailed_explanation=parsed["detailed_explanation"],
-            rationale=[
-                RationaleFact(**item) for item in parsed["rationale"]
-            ],
-            policy_summary=[
-                PolicyEvent(**item) for item in parsed["policy_summary"]
-            ],
-            numeric_snapshots=NumericSnapshot(**numeric_snapshots),
-            recommended_actions=[
-                RecommendedAction(**item) for item in parsed["recommended_actions"]
-            ],
-            confidence=float(parsed["confidence"]),
-            explainability_trace=[
-                ExplainabilityTrace(**item) for item in parsed["explainability_trace"]
-            ],
-        )
-
-        return explanation
+        # Required fields, nested records and numeric types are checked and the
+        # dataclasses built in one pydantic-core pass (ValidationError is a ValueError).
+        return _RECORD_ADAPTER.validate_python(parsed)
 
     def _fallback_explanation(
         self,
@@ -534,25 +883,21 @@ Respond with valid JSON matching the ExplanationRecord schema."""
         request = payload["request"]
 
         unit_price = latest_offer["components"]["unit_price"]
-        budget_per_unit = request.get("budget_per_unit", 0)
+        budget_per_unit = request.get("budget_per_unit") or 0
         decision = payload["decision"]
         round_num = payload["metadata"]["round"]
 
         # Generate simple fallback
-        short_summary = (
-            f"Round {round_num}: Current offer at ${unit_price:.2f}/unit. "
-            f"Engine decision: {decision}."
-        )
-
-        detailed_explanation = (
-            f"Negotiation round {round_num} summary:\n"
-            f"- Current unit price: ${unit_price:.2f}\n"
-            f"- Budget per unit: ${budget_per_unit:.2f}\n"
-            f"- Engine decision: {decision}\n"
-            f"- Policy events: {len(payload['policy_events'])} recorded\n\n"
-            f"Note: Full LLM explanation unavailable due to error: {error}\n"
-            f"This is a deterministic fallback summary."
-        )
+        fields = {
+            "round": round_num,
+            "unit_price": unit_price,
+            "budget_per_unit": budget_per_unit,
+            "decision": decision,
+            "policy_events": len(payload["policy_events"]),
+            "error": error,
+        }
+        short_summary = _FALLBACK_SUMMARY.format_map(fields)
+        detailed_explanation = _FALLBACK_DETAIL.format_map(fields)
 
         return ExplanationRecord(
             explanation_version=self.explanation_version,
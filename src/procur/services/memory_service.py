@@ -1,15 +1,60 @@
 from __future__ import annotations
 
-from typing import Dict, Iterable, Optional
+import sqlite3
+import sys
+from array import array
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Union
+
+try:  # pragma: no cover - optional dependency
+    import numpy as np  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency
+    np = None  # type: ignore[assignment]
 
 from ..models import NegotiationMemory, RoundMemory
 
 
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS negotiation_memory (
+    request_id TEXT NOT NULL,
+    vendor_id TEXT NOT NULL,
+    outcome TEXT NOT NULL,
+    savings REAL,
+    payload TEXT NOT NULL,
+    PRIMARY KEY (request_id, vendor_id)
+)
+"""
+
+
 class MemoryService:
-    """Persists structured negotiation memories for retrieval/training."""
+    """Persists structured negotiation memories for retrieval/training.
+
+    Finalized sessions are also indexed column-wise (key, outcome, savings) so
+    :meth:`iter_finalized` can filter without touching each memory object.
+
+    With ``db_path`` set, finalized sessions are written to a SQLite database
+    (WAL mode) and dropped from the in-process store; they are read back on
+    demand and survive restarts. Only sessions still in progress are held as
+    Python objects. The database belongs to a single ``MemoryService``: the
+    finalized index is loaded once at startup and :meth:`clear` empties the
+    whole table, so do not point several live workers at the same file.
+    """
 
-    def __init__(self) -> None:
+    def __init__(self, db_path: Optional[Union[str, Path]] = None) -> None:
         self._store: Dict[tuple[str, str], NegotiationMemory] = {}
+        self._final_rows: Dict[tuple[str, str], int] = {}
+        self._final_keys: List[tuple[str, str]] = []
+        self._final_outcomes: List[str] = []
+        self._final_savings = array("d")  # NaN when a session reported no savings
+        self._db: Optional[sqlite3.Connection] = None
+        if db_path is not None:
+            self._db = sqlite3.connect(str(db_path), check_same_thread=False, isolation_level=None)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(_SCHEMA)
+            for request_id, vendor_id, outcome, savings in self._db.execute(
+                "SELECT request_id, vendor_id, outcome, savings FROM negotiation_memory"
+            ):
+                self._index_final((sys.intern(request_id), sys.intern(vendor_id)), outcome, savings)
 
     def start_session(
         self,
@@ -18,28 +63,26 @@ class MemoryService:
         *,
         scenario_tags: Optional[Iterable[str]] = None,
     ) -> NegotiationMemory:
-        key = (request_id, vendor_id)
-        if key not in self._store:
-            memory = NegotiationMemory(
-                request_id=request_id,
-                vendor_id=vendor_id,
+        key = (sys.intern(request_id), sys.intern(vendor_id))
+        memory = self._store.get(key)
+        if memory is None and self._db is not None:
+            memory = self._load(key)
+            if memory is not None:
+                self._store[key] = memory  # reopened: keep it live until finalized again
+        if memory is None:
+            memory = self._store[key] = NegotiationMemory(
+                request_id=key[0],
+                vendor_id=key[1],
                 scenario_tags=list(scenario_tags or []),
             )
-            self._store[key] = memory
-        else:
-            memory = self._store[key]
-            if scenario_tags:
-                existing = set(memory.scenario_tags)
-                for tag in scenario_tags:
-                    if tag not in existing:
-                        memory.scenario_tags.append(tag)
+        elif scenario_tags:
+            memory.scenario_tags = list(dict.fromkeys([*memory.scenario_tags, *scenario_tags]))
         return memory
 
     def record_round(self, round_memory: RoundMemory) -> None:
-        session = self.start_session(
-            round_memory.request_id,
-            round_memory.vendor_id,
-        )
+        session = self._store.get((round_memory.request_id, round_memory.vendor_id))
+        if session is None:
+            session = self.start_session(round_memory.request_id, round_memory.vendor_id)
         session.add_round(round_memory)
 
     def finalize_session(
@@ -53,11 +96,90 @@ class MemoryService:
         session = self.start_session(request_id, vendor_id)
         session.finalize(outcome, savings)
 
+        key = (session.request_id, session.vendor_id)
+        self._index_final(key, outcome, savings)
+        if self._db is not None:
+            self._db.execute(
+                "INSERT OR REPLACE INTO negotiation_memory VALUES (?, ?, ?, ?, ?)",
+                (key[0], key[1], outcome, savings, session.model_dump_json()),
+            )
+            self._store.pop(key, None)
+
+    def _index_final(self, key: tuple[str, str], outcome: str, savings: Optional[float]) -> None:
+        saved = float("nan") if savings is None else float(savings)
+        row = self._final_rows.get(key)
+        if row is None:
+            self._final_rows[key] = len(self._final_keys)
+            self._final_keys.append(key)
+            self._final_outcomes.append(outcome)
+            self._final_savings.append(saved)
+        else:
+            self._final_outcomes[row] = outcome
+            self._final_savings[row] = saved
+
     def get_memory(self, request_id: str, vendor_id: str) -> Optional[NegotiationMemory]:
-        return self._store.get((request_id, vendor_id))
+        key = (request_id, vendor_id)
+        memory = self._store.get(key)
+        if memory is None and self._db is not None:
+            memory = self._load(key)
+        return memory
 
     def all_memories(self) -> list[NegotiationMemory]:
-        return list(self._store.values())
+        memories = list(self._store.values())
+        if self._db is not None:
+            memories.extend(
+                NegotiationMemory.model_validate_json(payload)
+                for request_id, vendor_id, payload in self._db.execute(
+                    "SELECT request_id, vendor_id, payload FROM negotiation_memory"
+                )
+                if (request_id, vendor_id) not in self._store
+            )
+        return memories
+
+    def _load(self, key: tuple[str, str]) -> Optional[NegotiationMemory]:
+        row = self._db.execute(
+            "SELECT payload FROM negotiation_memory WHERE request_id = ? AND vendor_id = ?", key
+        ).fetchone()
+        return NegotiationMemory.model_validate_json(row[0]) if row else None
+
+    def iter_finalized(
+        self,
+        outcome: Optional[str] = None,
+        min_savings: Optional[float] = None,
+    ) -> Iterator[NegotiationMemory]:
+        """Yield finalized memories, optionally filtered by outcome and minimum savings.
+
+        Sessions without reported savings never satisfy ``min_savings``.
+        """
+        if np is not None and self._final_keys:
+            mask = np.ones(len(self._final_keys), dtype=bool)
+            if outcome is not None:
+                mask &= np.asarray(self._final_outcomes, dtype=object) == outcome
+            if min_savings is not None:
+                mask &= np.frombuffer(self._final_savings, dtype=np.float64) >= min_savings
+            rows: Iterable[int] = np.flatnonzero(mask).tolist()
+        else:
+            rows = (
+                row
+                for row in range(len(self._final_keys))
+                if (outcome is None or self._final_outcomes[row] == outcome)
+                and (min_savings is None or self._final_savings[row] >= min_savings)
+            )
+        store = self._store
+        keys = self._final_keys
+        for row in rows:
+            memory = store.get(keys[row])
+            if memory is None and self._db is not None:
+                memory = self._load(keys[row])
+            if memory is not None:
+                yield memory
 
     def clear(self) -> None:
+        """Forget every session, including any persisted to ``db_path``."""
+        if self._db is not None:
+            self._db.execute("DELETE FROM negotiation_memory")
         self._store.clear()
+        self._final_rows.clear()
+        self._final_keys.clear()
+        self._final_outcomes.clear()
+        del self._final_savings[:]
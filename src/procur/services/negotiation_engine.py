@@ -2,16 +2,25 @@ from __future__ import annotations
 
 import math
 import random
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime
 from decimal import Decimal
 from enum import Enum
-from typing import Dict, List, Optional, Tuple
+from functools import lru_cache
+from typing import Callable, Deque, Dict, List, Optional, Sequence, Tuple
+
+try:  # pragma: no cover - optional dependency
+    import numpy as np  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency
+    np = None  # type: ignore[assignment]
 
 from ..models import Request, VendorProfile, Offer, OfferComponents, PaymentTerms, NegotiationDecision
+from .concession_engine import ConcessionEngine, _best_effective_price_for_policy, _policy_key
 from .policy_engine import PolicyEngine, PolicyResult
 from .scoring_service import ScoringService
 from .evaluation import (
+    TCOBreakdown,
     TCOInputs,
     compute_tco,
     compute_buyer_utility,
@@ -22,6 +31,173 @@ from .evaluation import (
 )
 
 
+@lru_cache(maxsize=4096)
+def _make_tco_inputs(
+    unit_price: float,
+    seats: int,
+    term_months: int,
+    one_time_positive: float,
+    credits: float,
+    prepay_discount_rate: float,
+) -> TCOInputs:
+    # Offers are re-costed many times per round (stalemate checks, bundle
+    # generation, closing checks); TCOInputs is frozen, so instances are shared.
+    return TCOInputs(
+        unit_price=Decimal(str(unit_price)),
+        seats=seats,
+        term_months=term_months,
+        one_time_fees=Decimal(str(one_time_positive)),
+        credits=Decimal(str(credits)),
+        payment_prepaid=False,
+        prepay_discount_rate=Decimal(str(prepay_discount_rate)),
+    )
+
+
+def _tco_key_from_fields(
+    unit_price: float,
+    quantity: int,
+    term_months: int,
+    one_time_fees: Optional[Dict[str, float]] = None,
+    prepay_discount_rate: float = 0.0,
+) -> Tuple[float, int, int, float, float, float]:
+    # Cache key for _make_tco_inputs/_tco_breakdown: positive fees and credits
+    # are split in one pass over the fee mapping.
+    one_time_positive = 0
+    credits = 0
+    for value in (one_time_fees or {}).values():
+        if value >= 0:
+            one_time_positive += value
+        else:
+            credits -= value
+    return (
+        unit_price or 0.0,
+        quantity or 1,
+        term_months or 12,
+        one_time_positive,
+        credits,
+        prepay_discount_rate,
+    )
+
+
+def _tco_float(
+    unit_price: float,
+    seats: int,
+    term_months: int,
+    one_time_positive: float,
+    credits: float,
+    prepay_discount_rate: float,
+) -> float:
+    # Same formula as compute_tco for these inputs (never prepaid), in float64.
+    return unit_price * seats * term_months / 12 + one_time_positive - credits
+
+
+@lru_cache(maxsize=4096)
+def _tco_breakdown(*key) -> TCOBreakdown:
+    return compute_tco(_make_tco_inputs(*key))
+
+
+BUYER_PAYMENT_PREFERENCE: Dict[PaymentTerms, float] = {
+    PaymentTerms.NET_15: 0.9,
+    PaymentTerms.NET_30: 1.0,
+    PaymentTerms.NET_45: 0.7,
+    PaymentTerms.MILESTONES: 0.85,
+    PaymentTerms.DEPOSIT: 0.6,
+}
+
+SELLER_PAYMENT_PREFERENCE: Dict[PaymentTerms, float] = {
+    PaymentTerms.NET_15: 1.0,
+    PaymentTerms.NET_30: 0.9,
+    PaymentTerms.NET_45: 0.7,
+    PaymentTerms.MILESTONES: 0.85,
+    PaymentTerms.DEPOSIT: 1.0,
+}
+
+
+# Lever preference used by the acceptance-probability model.
+ACCEPTANCE_PAYMENT_PREFERENCE: Dict[PaymentTerms, float] = {
+    PaymentTerms.NET_30: 1.0,
+    PaymentTerms.NET_15: 0.9,
+    PaymentTerms.NET_45: 0.8,
+    PaymentTerms.MILESTONES: 0.7,
+    PaymentTerms.DEPOSIT: 0.6,
+}
+
+PAYMENT_TERM_DAYS: Dict[PaymentTerms, int] = {
+    PaymentTerms.NET_15: 15,
+    PaymentTerms.NET_30: 30,
+    PaymentTerms.NET_45: 45,
+    PaymentTerms.MILESTONES: 30,
+    PaymentTerms.DEPOSIT: 0,
+}
+
+
+# Utility is re-evaluated for every bundle every round, but the request's
+# requirements and the vendor's tags rarely change within a negotiation. These
+# caches are keyed on the item tuples themselves, so an edited list simply misses.
+@lru_cache(maxsize=2048)
+def _lower_frozenset(items: Tuple[str, ...]) -> frozenset:
+    return frozenset(item.lower() for item in items)
+
+
+@lru_cache(maxsize=2048)
+def _required_features(must_haves: Tuple[str, ...], features: Tuple[str, ...]) -> Tuple[str, ...]:
+    return tuple(dict.fromkeys([*must_haves, *features]))
+
+
+@lru_cache(maxsize=2048)
+def _feature_fit_score(required: Tuple[str, ...], vendor_features: Tuple[str, ...]) -> float:
+    score = compute_feature_score(must_haves=required, vendor_features=vendor_features)
+    return max(0.0, min(score.score, 1.0))
+
+
+def _bundle_utilities(
+    tcos: Sequence[float],
+    terms: Sequence[int],
+    payment_fits: Sequence[float],
+    budgets: Sequence[float],
+    feature_fits: Sequence[float],
+    compliance_fits: Sequence[float],
+) -> List[float]:
+    # Unclamped buyer utility per bundle, one column per input; the same
+    # arithmetic as NegotiationEngine.calculate_utility.
+    if np is None:
+        utilities = []
+        for tco, term, payment_fit, budget_max, feature_fit, compliance_fit in zip(
+            tcos, terms, payment_fits, budgets, feature_fits, compliance_fits
+        ):
+            cost_fit = min(budget_max / tco, 1.0) if budget_max > 0 and tco > 0 else 0.0
+            term_fit = max(0.0, 1 - abs(term - 12) / 24)
+            utilities.append(
+                0.4 * cost_fit
+                + 0.2 * feature_fit
+                + 0.2 * compliance_fit
+                + 0.1 * term_fit
+                + 0.1 * payment_fit
+            )
+        return utilities
+
+    tco_arr = np.asarray(tcos, dtype=float)
+    budget_arr = np.asarray(budgets, dtype=float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        cost_fit = np.where(
+            (budget_arr > 0) & (tco_arr > 0), np.minimum(budget_arr / tco_arr, 1.0), 0.0
+        )
+    term_fit = np.maximum(0.0, 1 - np.abs(np.asarray(terms, dtype=float) - 12) / 24)
+    return (
+        0.4 * cost_fit
+        + 0.2 * np.asarray(feature_fits, dtype=float)
+        + 0.2 * np.asarray(compliance_fits, dtype=float)
+        + 0.1 * term_fit
+        + 0.1 * np.asarray(payment_fits, dtype=float)
+    ).tolist()
+
+
+def _leveraged_price(price: float, leverage_discount: float, floor_price: float) -> float:
+    # Numeric core of the leverage discount: primitives in, primitive out.
+    adjusted = price * (1 - leverage_discount)
+    return max(adjusted, floor_price) if floor_price else adjusted
+
+
 class NegotiationStrategy(Enum):
     """Buyer negotiation strategies"""
     PRICE_ANCHOR = "price_anchor"
@@ -43,7 +219,7 @@ class SellerStrategy(Enum):
     GRADUAL_CONCESSION = "gradual_concession"
 
 
-@dataclass
+@dataclass(slots=True)
 class OpponentModel:
     """Model of opponent's constraints and behavior"""
     price_floor_estimate: float
@@ -51,10 +227,34 @@ class OpponentModel:
     price_elasticity: float = 0.5
     term_elasticity: float = 0.3
     consecutive_no_price_moves: int = 0
-    last_offers: List[OfferComponents] = field(default_factory=list)
+    # Only the two most recent offers are read; older rounds survive as the
+    # running price summary below.
+    last_offers: Deque[OfferComponents] = field(default_factory=lambda: deque(maxlen=2))
+    # Unit-price change between the two most recent offers, kept by record_offer.
+    price_trend: Optional[float] = None
+    # Exponentially weighted mean/variance of every unit price seen so far.
+    price_ema: Optional[float] = None
+    price_variance: float = 0.0
+    price_smoothing: float = 0.5
+
+    def record_offer(self, offer: OfferComponents) -> None:
+        price = offer.unit_price
+        if self.last_offers:
+            self.price_trend = price - self.last_offers[-1].unit_price
+        self.last_offers.append(offer)
+
+        if self.price_ema is None:
+            self.price_ema = price
+            return
+        # Incremental (Welford-style) update of the weighted mean and variance.
+        alpha = self.price_smoothing
+        delta = price - self.price_ema
+        step = alpha * delta
+        self.price_ema += step
+        self.price_variance = (1.0 - alpha) * (self.price_variance + delta * step)
 
 
-@dataclass
+@dataclass(slots=True)
 class OfferBundle:
     """Multi-dimensional offer bundle"""
     price: float
@@ -65,7 +265,7 @@ class OfferBundle:
     utility: float = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class CompetingOffer:
     """Comparable offer from another vendor used for leverage."""
 
@@ -74,14 +274,14 @@ class CompetingOffer:
     total_cost: float
 
 
-@dataclass
+@dataclass(slots=True)
 class ExchangeRule:
     description: str
     minimum_delta: float
     leverage: str
 
 
-@dataclass
+@dataclass(slots=True)
 class ExchangePolicy:
     """Deterministic exchange rates for price-for-lever trades"""
 
@@ -107,7 +307,11 @@ class ExchangePolicy:
     max_rounds: int = 8
 
 
-@dataclass
+# Read-only stand-in for states without a plan; never hand it out for mutation.
+_DEFAULT_EXCHANGE_POLICY = ExchangePolicy()
+
+
+@dataclass(slots=True)
 class NegotiationPlan:
     anchors: Dict[str, float]
     concession_ladder: List[str]
@@ -119,7 +323,7 @@ class NegotiationPlan:
     exchange_policy: ExchangePolicy = field(default_factory=ExchangePolicy)
 
 
-@dataclass
+@dataclass(slots=True)
 class VendorNegotiationState:
     vendor: VendorProfile
     round: int = 0
@@ -127,6 +331,7 @@ class VendorNegotiationState:
     active: bool = True
     concession_index: int = 0
     history: List[Offer] = field(default_factory=list)
+    history_tco: List[float] = field(default_factory=list)  # parallel to history, see record_offer
     # Enhanced with opponent modeling
     opponent_model: Optional[OpponentModel] = None
     stalemate_rounds: int = 0
@@ -140,6 +345,7 @@ class VendorNegotiationState:
     concession_notes: List[str] = field(default_factory=list)
     match_summary: Optional[object] = None
     competing_offers: List[CompetingOffer] = field(default_factory=list)
+    best_competitor: Optional[CompetingOffer] = None  # kept current by NegotiationEngine.set_competing_offers
 
 
 class AdvancedNegotiationStrategies:
@@ -158,7 +364,9 @@ class AdvancedNegotiationStrategies:
         if state.best_offer is None:
             return None
 
-        best_competitor = min(state.competing_offers, key=lambda offer: offer.total_cost)
+        best_competitor = state.best_competitor
+        if best_competitor is None:
+            best_competitor = min(state.competing_offers, key=lambda offer: offer.total_cost)
         best_price = best_competitor.unit_price
         current_price = state.best_offer.components.unit_price
 
@@ -185,11 +393,12 @@ class AdvancedNegotiationStrategies:
             return 0.15
         return 0.0
 
-    def seasonal_timing(self, vendor: VendorProfile) -> float:
+    def seasonal_timing(self, vendor: VendorProfile, today: Optional[datetime] = None) -> float:
         """Increase leverage near quarter/year end when vendors chase targets."""
-        if self.is_end_of_quarter():
+        today = today or datetime.utcnow()
+        if self.is_end_of_quarter(today):
             return 0.10
-        if self.is_end_of_year():
+        if self.is_end_of_year(today):
             return 0.12
         return 0.0
 
@@ -197,18 +406,20 @@ class AdvancedNegotiationStrategies:
     # Utility helpers
     # ------------------------------------------------------------------
     @staticmethod
-    def is_end_of_quarter() -> bool:
-        today = datetime.utcnow()
+    def is_end_of_quarter(today: Optional[datetime] = None) -> bool:
+        today = today or datetime.utcnow()
         return today.month in {3, 6, 9, 12} and today.day >= 20
 
     @staticmethod
-    def is_end_of_year() -> bool:
-        today = datetime.utcnow()
+    def is_end_of_year(today: Optional[datetime] = None) -> bool:
+        today = today or datetime.utcnow()
         return today.month == 12 and today.day >= 10
 
-    def combined_discount(self, request: Request, vendor: VendorProfile) -> float:
+    def combined_discount(
+        self, request: Request, vendor: VendorProfile, today: Optional[datetime] = None
+    ) -> float:
         volume = self.volume_discounting(request)
-        seasonal = self.seasonal_timing(vendor)
+        seasonal = self.seasonal_timing(vendor, today)
         return min(volume + seasonal, 0.30)
 
 class NegotiationEngine:
@@ -234,26 +445,73 @@ class NegotiationEngine:
         SELLER_ACCEPT_THRESHOLD = seller_accept_threshold
         MAX_STALLED_ROUNDS = max_stalled_rounds
         self.advanced_strategies = AdvancedNegotiationStrategies(self)
+        # Strategies without an entry fall back to _bundle_incremental.
+        self._bundle_generators = {
+            NegotiationStrategy.PRICE_ANCHOR: self._bundle_price_anchor,
+            NegotiationStrategy.TERM_TRADE: self._bundle_term_trade,
+            NegotiationStrategy.PAYMENT_TRADE: self._bundle_payment_trade,
+            NegotiationStrategy.VALUE_ADD: self._bundle_value_add,
+            NegotiationStrategy.ULTIMATUM: self._bundle_ultimatum,
+        }
+        # Seller strategies without an entry fall back to _seller_target_gradual.
+        self._seller_targets = {
+            SellerStrategy.ANCHOR_HIGH: self._seller_target_anchor_high,
+            SellerStrategy.REJECT_BELOW_FLOOR: self._seller_target_reject_below_floor,
+            SellerStrategy.MINIMAL_CONCESSION: self._seller_target_minimal_concession,
+            SellerStrategy.TERM_VALUE: self._seller_target_term_value,
+            SellerStrategy.PAYMENT_PREMIUM: self._seller_target_payment_premium,
+            SellerStrategy.CLOSE_DEAL: self._seller_target_close_deal,
+        }
 
-    def _offer_to_tco_inputs(self, offer: OfferComponents) -> TCOInputs:
-        one_time_positive = sum(value for value in offer.one_time_fees.values() if value >= 0)
-        credits = -sum(value for value in offer.one_time_fees.values() if value < 0)
-        return TCOInputs(
-            unit_price=Decimal(str(offer.unit_price or 0.0)),
-            seats=offer.quantity or 1,
-            term_months=offer.term_months or 12,
-            one_time_fees=Decimal(str(one_time_positive)),
-            credits=Decimal(str(credits)),
-            payment_prepaid=False,
-            prepay_discount_rate=Decimal(str(getattr(offer, "prepay_discount_rate", 0.0))),
+    @staticmethod
+    def _tco_key(offer: OfferComponents) -> Tuple[float, int, int, float, float, float]:
+        return _tco_key_from_fields(
+            offer.unit_price,
+            offer.quantity,
+            offer.term_months,
+            offer.one_time_fees,
+            getattr(offer, "prepay_discount_rate", 0.0),
+        )
+
+    @staticmethod
+    def set_competing_offers(state: VendorNegotiationState, offers: Sequence[CompetingOffer]) -> None:
+        """Attach competing offers to a state and remember the cheapest one."""
+        state.competing_offers = list(offers)
+        state.best_competitor = (
+            min(state.competing_offers, key=lambda offer: offer.total_cost)
+            if state.competing_offers
+            else None
         )
 
+    def _offer_to_tco_inputs(self, offer: OfferComponents) -> TCOInputs:
+        return _make_tco_inputs(*self._tco_key(offer))
+
     def calculate_tco_breakdown(self, offer: OfferComponents):
-        return compute_tco(self._offer_to_tco_inputs(offer))
+        return _tco_breakdown(*self._tco_key(offer))
 
     def calculate_tco(self, offer: OfferComponents) -> float:
         return float(self.calculate_tco_breakdown(offer).total)
 
+    def calculate_tco_from_fields(
+        self,
+        unit_price: float,
+        quantity: int,
+        term_months: int,
+        one_time_fees: Optional[Dict[str, float]] = None,
+    ) -> float:
+        """:meth:`calculate_tco` for an offer that has not been built as ``OfferComponents``."""
+        key = _tco_key_from_fields(unit_price, quantity, term_months, one_time_fees)
+        return float(_tco_breakdown(*key).total)
+
+    def calculate_tco_fast(self, offer: OfferComponents) -> float:
+        """Float approximation of :meth:`calculate_tco` for internal heuristics.
+
+        Skips the exact-cents pipeline, so it can differ from the quoted TCO by a
+        rounding cent; use :meth:`calculate_tco` for anything shown or compared
+        against a budget.
+        """
+        return _tco_float(*self._tco_key(offer))
+
     def calculate_utility(
         self,
         offer: OfferComponents,
@@ -298,9 +556,47 @@ class NegotiationEngine:
 
         return 0.6 * margin_utility + 0.25 * term_preference + 0.15 * payment_preference
 
+    def score_bundles(
+        self,
+        batches: Sequence[Tuple[Request, Optional[VendorProfile], OfferComponents, Sequence[OfferBundle]]],
+    ) -> None:
+        """Fill in ``tco`` and buyer ``utility`` for candidate bundles of many negotiations.
+
+        Each batch is ``(request, vendor, current_offer, bundles)``; bundles take
+        their quantity from ``current_offer``. Utilities match
+        :meth:`calculate_utility`, but every bundle from every batch is scored in
+        one pass, with feature and compliance fits computed once per batch.
+        """
+        rows: List[OfferBundle] = []
+        tcos: List[float] = []
+        terms: List[int] = []
+        payment_fits: List[float] = []
+        budgets: List[float] = []
+        feature_fits: List[float] = []
+        compliance_fits: List[float] = []
+        for request, vendor, current_offer, bundles in batches:
+            budget_max = request.budget_max or 0.0
+            feature_fit = self._feature_fit(request, vendor)
+            compliance_fit = self._compliance_fit(request, vendor)
+            for bundle in bundles:
+                rows.append(bundle)
+                tcos.append(
+                    self.calculate_tco_from_fields(bundle.price, current_offer.quantity, bundle.term_months)
+                )
+                terms.append(bundle.term_months)
+                payment_fits.append(self._buyer_payment_preference(bundle.payment_terms))
+                budgets.append(budget_max)
+                feature_fits.append(feature_fit)
+                compliance_fits.append(compliance_fit)
+
+        utilities = _bundle_utilities(tcos, terms, payment_fits, budgets, feature_fits, compliance_fits)
+        for bundle, tco, utility in zip(rows, tcos, utilities):
+            bundle.tco = tco
+            bundle.utility = round(min(max(utility, 0.0), 1.0), 4)
+
     def _feature_fit(self, request: Request, vendor: Optional[VendorProfile]) -> float:
-        required_features = list(
-            dict.fromkeys([*request.must_haves, *request.specs.get("features", [])])
+        required_features = _required_features(
+            tuple(request.must_haves), tuple(request.specs.get("features", []))
         )
 
         if not required_features:
@@ -308,31 +604,20 @@ class NegotiationEngine:
         if vendor is None:
             return 0.6
 
-        score = compute_feature_score(
-            must_haves=required_features,
-            vendor_features=vendor.capability_tags,
-        )
-        return max(0.0, min(score.score, 1.0))
+        return _feature_fit_score(required_features, tuple(vendor.capability_tags))
 
     def _compliance_fit(self, request: Request, vendor: Optional[VendorProfile]) -> float:
-        requirements = {req.lower() for req in request.compliance_requirements}
+        requirements = _lower_frozenset(tuple(request.compliance_requirements))
         if not requirements:
             return 1.0
         if vendor is None:
             return 0.6
-        vendor_certs = {cert.lower() for cert in vendor.certifications}
+        vendor_certs = _lower_frozenset(tuple(vendor.certifications))
         matches = len(requirements & vendor_certs)
         return max(0.0, min(matches / len(requirements), 1.0))
 
     def _buyer_payment_preference(self, payment_terms: PaymentTerms) -> float:
-        mapping = {
-            PaymentTerms.NET_15: 0.9,
-            PaymentTerms.NET_30: 1.0,
-            PaymentTerms.NET_45: 0.7,
-            PaymentTerms.MILESTONES: 0.85,
-            PaymentTerms.DEPOSIT: 0.6,
-        }
-        return mapping.get(payment_terms, 0.75)
+        return BUYER_PAYMENT_PREFERENCE.get(payment_terms, 0.75)
 
     def _strategy_for_lever(self, lever: str) -> NegotiationStrategy:
         mapping = {
@@ -380,26 +665,25 @@ class NegotiationEngine:
         # Check if last MAX_STALLED_ROUNDS rounds had minimal progress
         recent_offers = state.history[-self.max_stalled_rounds:]
         if len(recent_offers) >= self.max_stalled_rounds:
-            utility_changes = []
-            tco_changes = []
+            # TCOs are recorded alongside history by record_offer; recompute only
+            # if the history was appended to some other way.
+            if len(state.history_tco) == len(state.history):
+                recent_tcos = state.history_tco[-self.max_stalled_rounds:]
+            else:
+                recent_tcos = [self.calculate_tco_fast(offer.components) for offer in recent_offers]
 
+            total_utility_change = 0.0
+            total_tco_improvement = 0.0
             for i in range(1, len(recent_offers)):
-                prev_offer = recent_offers[i-1]
-                curr_offer = recent_offers[i]
-
                 # Track utility improvement
-                utility_change = abs(curr_offer.score.utility - prev_offer.score.utility)
-                utility_changes.append(utility_change)
-
+                total_utility_change += abs(recent_offers[i].score.utility - recent_offers[i - 1].score.utility)
                 # Track TCO improvement (lower is better, so we look for decreases)
-                prev_tco = self.calculate_tco(prev_offer.components)
-                curr_tco = self.calculate_tco(curr_offer.components)
-                tco_improvement = max(0, prev_tco - curr_tco)  # Positive if TCO decreased
-                tco_changes.append(tco_improvement)
+                total_tco_improvement += max(0, recent_tcos[i - 1] - recent_tcos[i])
 
             # If average utility improvement and TCO improvement are both less than ε, consider stalemate
-            avg_utility_change = sum(utility_changes) / len(utility_changes) if utility_changes else 0
-            avg_tco_improvement = sum(tco_changes) / len(tco_changes) if tco_changes else 0
+            steps = len(recent_offers) - 1
+            avg_utility_change = total_utility_change / steps if steps else 0
+            avg_tco_improvement = total_tco_improvement / steps if steps else 0
 
             # ε thresholds for considering progress stalled
             utility_epsilon = 0.01  # 1% utility improvement
@@ -412,7 +696,7 @@ class NegotiationEngine:
     def update_opponent_model(self, model: OpponentModel, new_offer: OfferComponents, previous_offer: Optional[OfferComponents]):
         """Update beliefs about opponent based on their moves with tighter bounds"""
         if previous_offer is None:
-            model.last_offers.append(new_offer)
+            model.record_offer(new_offer)
             return
             
         # Track price movement
@@ -440,98 +724,141 @@ class NegotiationEngine:
         if abs(term_change) > 0:
             model.term_elasticity = min(0.9, model.term_elasticity + 0.1)
             
-        model.last_offers.append(new_offer)
-        if len(model.last_offers) > 3:
-            model.last_offers.pop(0)
+        model.record_offer(new_offer)
 
     def generate_target_bundle(self, strategy: NegotiationStrategy, request: Request, 
                              current_offer: OfferComponents, state: VendorNegotiationState) -> OfferBundle:
         """Generate target bundle based on strategy with consistency enforcement"""
         base_price = current_offer.unit_price
-        policy = state.plan.exchange_policy if state.plan else ExchangePolicy()
+        policy = state.plan.exchange_policy if state.plan else _DEFAULT_EXCHANGE_POLICY
         leverage_discount = self.advanced_strategies.combined_discount(request, state.vendor)
+        floor_price = state.vendor.guardrails.price_floor or 0.0
         discount_noted = False
 
         def apply_extra(price: float) -> float:
             nonlocal discount_noted
             if leverage_discount <= 0:
                 return price
-            adjusted = price * (1 - leverage_discount)
             if not discount_noted:
                 state.concession_notes.append(
                     f"Applied advanced leverage discount {leverage_discount:.0%}"
                 )
                 discount_noted = True
-            floor_price = state.vendor.guardrails.price_floor or 0.0
-            minimum = floor_price if floor_price else adjusted
-            return max(adjusted, minimum)
-
-        if strategy == NegotiationStrategy.PRICE_ANCHOR:
-            target_price = base_price * 0.85  # Aggressive anchor
-            target_price = min(target_price, apply_extra(base_price))
-            return OfferBundle(
-                price=target_price,
-                term_months=current_offer.term_months,
-                payment_terms=current_offer.payment_terms,
-                value_adds={}
-            )
-            
-        elif strategy == NegotiationStrategy.TERM_TRADE:
-            # STRATEGY CONSISTENCY: term_trade MUST increase terms
-            new_term = max(current_offer.term_months + 12, 24)  # Force increase
-            price_reduction = self._term_discount(policy, current_offer.term_months, new_term)
-            target_price = base_price * (1 - price_reduction)
-            target_price = apply_extra(target_price)
-            
-            return OfferBundle(
-                price=max(target_price, base_price * 0.90),  # Floor at 10% reduction
-                term_months=new_term,
-                payment_terms=current_offer.payment_terms,
-                value_adds={}
-            )
-            
-        elif strategy == NegotiationStrategy.PAYMENT_TRADE:
-            # Apply deterministic exchange rate for faster payment
-            discount = self._payment_discount(policy, PaymentTerms.NET_15)
-            target_price = base_price * (1 - discount)
-            target_price = apply_extra(target_price)
-            return OfferBundle(
-                price=target_price,
-                term_months=current_offer.term_months,
-                payment_terms=PaymentTerms.NET_15,  # Faster payment
-                value_adds={}
-            )
-            
-        elif strategy == NegotiationStrategy.VALUE_ADD:
-            # Request training credits at deterministic value
-            value_adds = {
-                key: self._value_add_credit(policy, key)
-                for key in policy.value_add_offsets.keys()
-            }
-            return OfferBundle(
-                price=base_price,  # No price change
-                term_months=current_offer.term_months,
-                payment_terms=current_offer.payment_terms,
-                value_adds=value_adds
-            )
-            
-        elif strategy == NegotiationStrategy.ULTIMATUM:
-            floor_estimate = state.opponent_model.price_floor_estimate if state.opponent_model else base_price * 0.8
-            return OfferBundle(
-                price=max(apply_extra(floor_estimate + 25), base_price * 0.92),
-                term_months=12,
-                payment_terms=PaymentTerms.NET_30,
-                value_adds={}
-            )
-        else:  # Default incremental with minimum step
-            price_reduction = max(policy.min_step_abs, base_price * 0.08)
-            target_price = apply_extra(base_price - price_reduction)
-            return OfferBundle(
-                price=target_price,
-                term_months=current_offer.term_months,
-                payment_terms=current_offer.payment_terms,
-                value_adds={}
-            )
+            return _leveraged_price(price, leverage_discount, floor_price)
+
+        generator = self._bundle_generators.get(strategy, self._bundle_incremental)
+        return generator(base_price, current_offer, policy, apply_extra, state)
+
+    def _bundle_price_anchor(
+        self,
+        base_price: float,
+        current_offer: OfferComponents,
+        policy: ExchangePolicy,
+        apply_extra: Callable[[float], float],
+        state: VendorNegotiationState,
+    ) -> OfferBundle:
+        target_price = base_price * 0.85  # Aggressive anchor
+        target_price = min(target_price, apply_extra(base_price))
+        return OfferBundle(
+            price=target_price,
+            term_months=current_offer.term_months,
+            payment_terms=current_offer.payment_terms,
+            value_adds={}
+        )
+
+    def _bundle_term_trade(
+        self,
+        base_price: float,
+        current_offer: OfferComponents,
+        policy: ExchangePolicy,
+        apply_extra: Callable[[float], float],
+        state: VendorNegotiationState,
+    ) -> OfferBundle:
+        # STRATEGY CONSISTENCY: term_trade MUST increase terms
+        new_term = max(current_offer.term_months + 12, 24)  # Force increase
+        price_reduction = self._term_discount(policy, current_offer.term_months, new_term)
+        target_price = base_price * (1 - price_reduction)
+        target_price = apply_extra(target_price)
+
+        return OfferBundle(
+            price=max(target_price, base_price * 0.90),  # Floor at 10% reduction
+            term_months=new_term,
+            payment_terms=current_offer.payment_terms,
+            value_adds={}
+        )
+
+    def _bundle_payment_trade(
+        self,
+        base_price: float,
+        current_offer: OfferComponents,
+        policy: ExchangePolicy,
+        apply_extra: Callable[[float], float],
+        state: VendorNegotiationState,
+    ) -> OfferBundle:
+        # Apply deterministic exchange rate for faster payment
+        discount = self._payment_discount(policy, PaymentTerms.NET_15)
+        target_price = base_price * (1 - discount)
+        target_price = apply_extra(target_price)
+        return OfferBundle(
+            price=target_price,
+            term_months=current_offer.term_months,
+            payment_terms=PaymentTerms.NET_15,  # Faster payment
+            value_adds={}
+        )
+
+    def _bundle_value_add(
+        self,
+        base_price: float,
+        current_offer: OfferComponents,
+        policy: ExchangePolicy,
+        apply_extra: Callable[[float], float],
+        state: VendorNegotiationState,
+    ) -> OfferBundle:
+        # Request training credits at deterministic value
+        value_adds = {
+            key: self._value_add_credit(policy, key)
+            for key in policy.value_add_offsets.keys()
+        }
+        return OfferBundle(
+            price=base_price,  # No price change
+            term_months=current_offer.term_months,
+            payment_terms=current_offer.payment_terms,
+            value_adds=value_adds
+        )
+
+    def _bundle_ultimatum(
+        self,
+        base_price: float,
+        current_offer: OfferComponents,
+        policy: ExchangePolicy,
+        apply_extra: Callable[[float], float],
+        state: VendorNegotiationState,
+    ) -> OfferBundle:
+        floor_estimate = state.opponent_model.price_floor_estimate if state.opponent_model else base_price * 0.8
+        return OfferBundle(
+            price=max(apply_extra(floor_estimate + 25), base_price * 0.92),
+            term_months=12,
+            payment_terms=PaymentTerms.NET_30,
+            value_adds={}
+        )
+
+    def _bundle_incremental(
+        self,
+        base_price: float,
+        current_offer: OfferComponents,
+        policy: ExchangePolicy,
+        apply_extra: Callable[[float], float],
+        state: VendorNegotiationState,
+    ) -> OfferBundle:
+        # Default incremental with minimum step
+        price_reduction = max(policy.min_step_abs, base_price * 0.08)
+        target_price = apply_extra(base_price - price_reduction)
+        return OfferBundle(
+            price=target_price,
+            term_months=current_offer.term_months,
+            payment_terms=current_offer.payment_terms,
+            value_adds={}
+        )
 
     def evaluate_stop_conditions(
         self,
@@ -571,6 +898,7 @@ class NegotiationEngine:
 
     def record_offer(self, state: VendorNegotiationState, offer: Offer) -> None:
         state.history.append(offer)
+        state.history_tco.append(self.calculate_tco_fast(offer.components))
         if not state.best_offer or offer.score.utility > state.best_offer.score.utility:
             state.best_offer = offer
 
@@ -587,9 +915,16 @@ class NegotiationEngine:
         if not current_offer:
             return False, "no_offer"
 
-        # Compute TCO breakdown, buyer and seller utilities
-        tco_breakdown = self.scoring_service.compute_tco_breakdown(current_offer)
+        # Before transitioning to ACCEPTED, enforce all invariants. Each input is
+        # computed just before its check so a rejection skips the later, costlier ones.
+
+        # 1. Budget compliance
+        if request.budget_max:
+            tco_breakdown = self.scoring_service.compute_tco_breakdown(current_offer)
+            if float(tco_breakdown.total) > request.budget_max:
+                return False, "budget_exceeded"
 
+        # 2. Buyer utility threshold
         summary = getattr(state, "match_summary", None)
         feature_score = summary.feature.score if summary else 0.0
         compliance_score = summary.compliance.score if summary else 0.0
@@ -605,7 +940,10 @@ class NegotiationEngine:
             compliance_score=compliance_score,
             sla_score=sla_score,
         )
+        if buyer_bd.buyer_utility < self.buyer_accept_threshold:
+            return False, "buyer_utility_too_low"
 
+        # 3. Seller utility threshold
         list_price = state.vendor.price_tiers.get(str(request.quantity), current_offer.unit_price)
         floor_price = state.vendor.guardrails.price_floor or current_offer.unit_price
         seller_bd = compute_seller_utility(
@@ -614,18 +952,6 @@ class NegotiationEngine:
             floor_price=floor_price,
             min_accept_threshold=self.seller_accept_threshold,
         )
-
-        # Before transitioning to ACCEPTED, enforce all invariants:
-
-        # 1. Budget compliance
-        if request.budget_max and float(tco_breakdown.total) > request.budget_max:
-            return False, "budget_exceeded"
-
-        # 2. Buyer utility threshold
-        if buyer_bd.buyer_utility < self.buyer_accept_threshold:
-            return False, "buyer_utility_too_low"
-
-        # 3. Seller utility threshold
         if seller_bd.seller_utility < self.seller_accept_threshold:
             return False, "seller_utility_too_low"
 
@@ -649,18 +975,20 @@ class NegotiationEngine:
             return False, "below_vendor_floor"
 
         # If all invariants pass, check convergence conditions
-        policy = state.plan.exchange_policy if state.plan else ExchangePolicy()
+        policy = state.plan.exchange_policy if state.plan else _DEFAULT_EXCHANGE_POLICY
 
         if state.opponent_model and len(state.opponent_model.last_offers) >= 2:
-            recent_offers = state.opponent_model.last_offers[-2:]
-            price_gap = abs(recent_offers[-1].unit_price - recent_offers[-2].unit_price)
+            recent_offers = state.opponent_model.last_offers
+            latest_price = recent_offers[-1].unit_price
+            previous_price = recent_offers[-2].unit_price
+            price_gap = abs(latest_price - previous_price)
 
             # Close if gap is small enough (absolute or percentage) AND price is moving in our favor
-            if price_gap < policy.finalize_gap_abs and recent_offers[-1].unit_price <= recent_offers[-2].unit_price:
+            if price_gap < policy.finalize_gap_abs and latest_price <= previous_price:
                 return True, "converged_absolute"
             if (current_offer.unit_price > 0 and
                 price_gap / current_offer.unit_price < policy.finalize_gap_pct and
-                recent_offers[-1].unit_price <= recent_offers[-2].unit_price):
+                latest_price <= previous_price):
                 return True, "converged_percentage"
 
         # Accept if all thresholds met
@@ -684,9 +1012,10 @@ class NegotiationEngine:
                 
         # Ensure monotonic progress (buyer prices should generally decrease)
         if len(state.opponent_model.last_offers) >= 2:
-            prev_offers = [o.unit_price for o in state.opponent_model.last_offers[-2:]]
-            if new_bundle.price > min(prev_offers):  # Going backwards
-                new_bundle.price = min(prev_offers) - 10  # Force progress
+            last_offers = state.opponent_model.last_offers
+            lowest_recent = min(last_offers[-1].unit_price, last_offers[-2].unit_price)
+            if new_bundle.price > lowest_recent:  # Going backwards
+                new_bundle.price = lowest_recent - 10  # Force progress
                 
         return new_bundle
 
@@ -712,22 +1041,8 @@ class NegotiationEngine:
             bundles.append(payment_alt)
             
         # Calculate TCO and utility for all bundles
-        for bundle in bundles:
-            mock_offer = OfferComponents(
-                unit_price=bundle.price,
-                currency=current_offer.currency,
-                quantity=current_offer.quantity,
-                term_months=bundle.term_months,
-                payment_terms=bundle.payment_terms
-            )
-            bundle.tco = self.calculate_tco(mock_offer)
-            bundle.utility = self.calculate_utility(
-                mock_offer,
-                request,
-                vendor=vendor,
-                is_buyer=True,
-            )
-            
+        self.score_bundles([(request, vendor, current_offer, bundles)])
+
         return bundles[:3]  # Limit to 3 options
 
     def determine_seller_strategy(self, state: VendorNegotiationState, buyer_offer: OfferComponents) -> SellerStrategy:
@@ -736,16 +1051,16 @@ class NegotiationEngine:
             return SellerStrategy.ANCHOR_HIGH
             
         # Analyze buyer behavior patterns
-        if len(state.opponent_model.last_offers) >= 2:
-            recent_offers = state.opponent_model.last_offers[-2:]
-            price_trend = recent_offers[-1].unit_price - recent_offers[-2].unit_price
-            
+        price_trend = state.opponent_model.price_trend
+        if price_trend is not None:
+            price_move = abs(price_trend)
+
             # If buyer is making aggressive moves, be firm
-            if abs(price_trend) > 50:
+            if price_move > 50:
                 return SellerStrategy.REJECT_BELOW_FLOOR
-                
+
             # If buyer is stalled, make minimal concession
-            if abs(price_trend) < 10:
+            if price_move < 10:
                 return SellerStrategy.MINIMAL_CONCESSION
         
         # Check if near floor price
@@ -767,45 +1082,11 @@ class NegotiationEngine:
         """Generate seller counter-offer based on strategy"""
         current_price = buyer_offer.unit_price
         floor_price = state.vendor.guardrails.price_floor
-        policy = state.plan.exchange_policy if state.plan else ExchangePolicy()
-        
-        if strategy == SellerStrategy.ANCHOR_HIGH:
-            # Start high to establish value perception
-            target_price = max(current_price * 1.15, floor_price * 1.3)
-            
-        elif strategy == SellerStrategy.REJECT_BELOW_FLOOR:
-            # Firm rejection, minimal movement
-            target_price = max(floor_price * 1.05, current_price * 1.02)
-            
-        elif strategy == SellerStrategy.MINIMAL_CONCESSION:
-            # Smallest possible concession
-            target_price = max(floor_price, current_price - policy.min_step_abs)
-            
-        elif strategy == SellerStrategy.TERM_VALUE:
-            # Reward longer terms with better pricing
-            if buyer_offer.term_months >= 24:
-                discount = self._term_discount(policy, 12, buyer_offer.term_months)
-                target_price = current_price * (1 - discount)
-            else:
-                target_price = current_price * 1.01  # Small increase for short terms
-                
-        elif strategy == SellerStrategy.PAYMENT_PREMIUM:
-            # Better pricing for faster payment
-            if buyer_offer.payment_terms == PaymentTerms.NET_15:
-                discount = self._payment_discount(policy, PaymentTerms.NET_15)
-                target_price = current_price * (1 - discount)
-            else:
-                premium = abs(self._payment_discount(policy, buyer_offer.payment_terms))
-                target_price = current_price * (1 + premium)
-                
-        elif strategy == SellerStrategy.CLOSE_DEAL:
-            # Final concession to close at floor
-            target_price = floor_price if floor_price is not None else current_price
-            
-        else:  # GRADUAL_CONCESSION
-            # Standard incremental reduction
-            target_price = max(floor_price, current_price - policy.min_step_abs)
+        policy = state.plan.exchange_policy if state.plan else _DEFAULT_EXCHANGE_POLICY
         
+        target = self._seller_targets.get(strategy, self._seller_target_gradual)
+        target_price = target(current_price, floor_price, policy, buyer_offer)
+
         return OfferComponents(
             unit_price=max(target_price, floor_price) if floor_price is not None else target_price,
             currency=buyer_offer.currency,
@@ -814,6 +1095,55 @@ class NegotiationEngine:
             payment_terms=buyer_offer.payment_terms
         )
 
+    def _seller_target_anchor_high(
+        self, current_price: float, floor_price: Optional[float], policy: ExchangePolicy, buyer_offer: OfferComponents
+    ) -> float:
+        # Start high to establish value perception
+        return max(current_price * 1.15, floor_price * 1.3)
+
+    def _seller_target_reject_below_floor(
+        self, current_price: float, floor_price: Optional[float], policy: ExchangePolicy, buyer_offer: OfferComponents
+    ) -> float:
+        # Firm rejection, minimal movement
+        return max(floor_price * 1.05, current_price * 1.02)
+
+    def _seller_target_minimal_concession(
+        self, current_price: float, floor_price: Optional[float], policy: ExchangePolicy, buyer_offer: OfferComponents
+    ) -> float:
+        # Smallest possible concession
+        return max(floor_price, current_price - policy.min_step_abs)
+
+    def _seller_target_term_value(
+        self, current_price: float, floor_price: Optional[float], policy: ExchangePolicy, buyer_offer: OfferComponents
+    ) -> float:
+        # Reward longer terms with better pricing
+        if buyer_offer.term_months >= 24:
+            discount = self._term_discount(policy, 12, buyer_offer.term_months)
+            return current_price * (1 - discount)
+        return current_price * 1.01  # Small increase for short terms
+
+    def _seller_target_payment_premium(
+        self, current_price: float, floor_price: Optional[float], policy: ExchangePolicy, buyer_offer: OfferComponents
+    ) -> float:
+        # Better pricing for faster payment
+        if buyer_offer.payment_terms == PaymentTerms.NET_15:
+            discount = self._payment_discount(policy, PaymentTerms.NET_15)
+            return current_price * (1 - discount)
+        premium = abs(self._payment_discount(policy, buyer_offer.payment_terms))
+        return current_price * (1 + premium)
+
+    def _seller_target_close_deal(
+        self, current_price: float, floor_price: Optional[float], policy: ExchangePolicy, buyer_offer: OfferComponents
+    ) -> float:
+        # Final concession to close at floor
+        return floor_price if floor_price is not None else current_price
+
+    def _seller_target_gradual(
+        self, current_price: float, floor_price: Optional[float], policy: ExchangePolicy, buyer_offer: OfferComponents
+    ) -> float:
+        # Standard incremental reduction
+        return max(floor_price, current_price - policy.min_step_abs)
+
     def feasible_with_trades(self, request: Request, vendor: VendorProfile, policy: ExchangePolicy) -> bool:
         """Test feasibility including trade scenarios (not just price-only ZOPA)"""
         if request.quantity <= 0:
@@ -823,17 +1153,8 @@ class NegotiationEngine:
         list_price = vendor.price_tiers.get(tier_key, vendor.guardrails.price_floor * 1.2)
         seller_floor = vendor.guardrails.price_floor or list_price
 
-        concessions = ConcessionEngine(
-            {
-                "term_trade": policy.term_trade,
-                "payment_trade": {term.value: pct for term, pct in policy.payment_trade.items()},
-                "value_add_offsets": policy.value_add_offsets,
-            }
-        )
-        best_price, _ = concessions.best_effective_price(
-            list_price=list_price,
-            floor_price=seller_floor,
-            seats=request.quantity,
+        best_price, _ = _best_effective_price_for_policy(
+            _policy_key(policy), list_price, seller_floor, request.quantity
         )
         return detect_zopa(
             buyer_budget_per_unit=budget_per_unit,
@@ -893,44 +1214,29 @@ class NegotiationEngine:
                 value_adds=value_adds
             ))
         
-        # Validate bundles and apply deadman switch
-        valid_bundles = []
-        for bundle in bundles:
-            tco = self.calculate_tco_for_bundle(bundle, request)
-            budget_max = request.budget_max or float('inf')
-            if tco <= budget_max * 1.1:  # Allow 10% budget flexibility
-                valid_bundles.append(bundle)
-        
+        # Validate bundles and apply deadman switch; each TCO is computed once
+        tcos = [self.calculate_tco_for_bundle(bundle, request) for bundle in bundles]
+        budget_limit = (request.budget_max or float('inf')) * 1.1  # Allow 10% budget flexibility
+        valid_bundles = [bundle for bundle, tco in zip(bundles, tcos) if tco <= budget_limit]
+
         # Deadman switch: if no bundles pass, choose least violating
         if not valid_bundles:
             # Find bundle with lowest TCO overage
-            best_bundle = min(bundles, key=lambda b: self.calculate_tco_for_bundle(b, request))
-            valid_bundles = [best_bundle]
-            
+            valid_bundles = [bundles[tcos.index(min(tcos))]]
+
         return valid_bundles
     
     def calculate_tco_for_bundle(self, bundle: OfferBundle, request: Request) -> float:
         """Calculate TCO for an offer bundle"""
-        mock_offer = OfferComponents(
-            unit_price=bundle.price,
-            currency="USD",
-            quantity=request.quantity,
-            term_months=bundle.term_months,
-            payment_terms=bundle.payment_terms
-        )
-        tco = self.calculate_tco(mock_offer)
-        
-        # Subtract value-adds
-        for value_type, amount in bundle.value_adds.items():
-            if value_type == "training_credits":
-                tco -= amount
-                
-        return tco
+        tco = self.calculate_tco_from_fields(bundle.price, request.quantity, bundle.term_months)
+        # Subtract value-adds (only training credits carry a dollar amount)
+        return tco - bundle.value_adds.get("training_credits", 0.0)
     
     def pv_benefit(self, amount: float, delta_days: int, annual_rate: float = 0.12) -> float:
         """Calculate present value benefit of delayed payment"""
-        r_daily = (1 + annual_rate) ** (1/365) - 1
-        return amount * (1 - 1/((1 + r_daily) ** delta_days))
+        # amount * (1 - (1 + annual_rate) ** (-delta_days / 365)), via log1p/expm1
+        # so short delays don't lose precision to the subtraction.
+        return amount * -math.expm1(-(delta_days / 365) * math.log1p(annual_rate))
     
     def maybe_close(self, buyer_price: float, seller_price: float, policy: ExchangePolicy, 
                    quantity: int, current_terms: tuple) -> List[OfferBundle]:
@@ -980,22 +1286,25 @@ class NegotiationEngine:
     def best_lever_by_yield(self, history: List[Offer]) -> str:
         """Find lever with best ΔScore per unit concession"""
         lever_yields = {"price": 0, "term": 0, "payment": 0, "value": 0}
-        
-        for i in range(1, len(history)):
-            prev_offer = history[i-1]
-            curr_offer = history[i]
-            score_change = curr_offer.score.utility - prev_offer.score.utility
-            
+
+        # Walk each offer's attributes once; every offer is both "curr" and "prev".
+        rows = [
+            (offer.components.unit_price, offer.components.term_months, offer.components.payment_terms, offer.score.utility)
+            for offer in history
+        ]
+        for (prev_price, prev_term, prev_payment, prev_utility), (price, term, payment, utility) in zip(rows, rows[1:]):
+            score_change = utility - prev_utility
+
             # Determine primary lever used
-            if abs(curr_offer.components.unit_price - prev_offer.components.unit_price) > 5:
+            if abs(price - prev_price) > 5:
                 lever_yields["price"] += score_change
-            elif curr_offer.components.term_months != prev_offer.components.term_months:
+            elif term != prev_term:
                 lever_yields["term"] += score_change
-            elif curr_offer.components.payment_terms != prev_offer.components.payment_terms:
+            elif payment != prev_payment:
                 lever_yields["payment"] += score_change
             else:
                 lever_yields["value"] += score_change
-        
+
         return max(lever_yields, key=lever_yields.get)
 
     def calculate_acceptance_probability(self, offer: OfferComponents, request: Request, 
@@ -1010,13 +1319,7 @@ class NegotiationEngine:
         
         # Lever fit: term and payment preferences
         term_preference = 1.0 - abs(offer.term_months - 12) / 24  # Prefer 12 months
-        payment_preference = {
-            PaymentTerms.NET_30: 1.0,
-            PaymentTerms.NET_15: 0.9,
-            PaymentTerms.NET_45: 0.8,
-            PaymentTerms.MILESTONES: 0.7,
-            PaymentTerms.DEPOSIT: 0.6
-        }.get(offer.payment_terms, 0.5)
+        payment_preference = ACCEPTANCE_PAYMENT_PREFERENCE.get(offer.payment_terms, 0.5)
         
         lever_fit = (term_preference + payment_preference) / 2
         
@@ -1035,23 +1338,62 @@ class NegotiationEngine:
         
         return min(1.0, probability * round_adjustment)
 
+    def calculate_acceptance_probability_batch(
+        self,
+        offers: Sequence[OfferComponents],
+        request: Request,
+        state: VendorNegotiationState,
+    ) -> List[float]:
+        """:meth:`calculate_acceptance_probability` for many candidate offers at once.
+
+        TCOs stay exact per offer; the fits, utility and logistic are evaluated
+        as NumPy arrays. Falls back to the scalar method without numpy.
+        """
+        if np is None:
+            return [self.calculate_acceptance_probability(offer, request, state) for offer in offers]
+        if not offers:
+            return []
+
+        tco = np.array([self.calculate_tco(offer) for offer in offers], dtype=np.float64)
+        terms = np.array([offer.term_months for offer in offers], dtype=np.float64)
+        count = len(offers)
+        raw_utility = _bundle_utilities(
+            tco,
+            terms,
+            [self._buyer_payment_preference(offer.payment_terms) for offer in offers],
+            [request.budget_max or 0.0] * count,
+            [self._feature_fit(request, state.vendor)] * count,
+            [self._compliance_fit(request, state.vendor)] * count,
+        )
+        utility = np.array([round(min(max(value, 0.0), 1.0), 4) for value in raw_utility])
+
+        price_fit = np.maximum(0, 1 - tco / request.budget_max)
+        term_preference = 1.0 - np.abs(terms - 12) / 24
+        payment_preference = np.array(
+            [ACCEPTANCE_PAYMENT_PREFERENCE.get(offer.payment_terms, 0.5) for offer in offers],
+            dtype=np.float64,
+        )
+        lever_fit = (term_preference + payment_preference) / 2
+        combined_score = (price_fit * 0.6) + (lever_fit * 0.2) + (utility * 0.2)
+
+        k = 8
+        threshold = 0.7
+        probability = 1 / (1 + np.exp(-k * (combined_score - threshold)))
+        round_adjustment = max(0.5, 1 - (state.round * 0.05))
+        return np.minimum(1.0, probability * round_adjustment).tolist()
+
     def _term_discount(self, policy: ExchangePolicy, current_term: int, new_term: int) -> float:
         if new_term <= current_term:
             return 0.0
         delta = new_term - current_term
-        if delta in policy.term_trade:
-            return policy.term_trade[delta]
-        base = policy.term_trade.get(12, 0.0)
-        return base * (delta / 12)
+        term_trade = policy.term_trade
+        discount = term_trade.get(delta)
+        if discount is not None:
+            return discount
+        return term_trade.get(12, 0.0) * (delta / 12)
 
     def _payment_term_days(self, terms: PaymentTerms) -> int:
-        return {
-            PaymentTerms.NET_15: 15,
-            PaymentTerms.NET_30: 30,
-            PaymentTerms.NET_45: 45,
-            PaymentTerms.MILESTONES: 30,
-            PaymentTerms.DEPOSIT: 0,
-        }.get(terms, 30)
+        return PAYMENT_TERM_DAYS.get(terms, 30)
 
     def _pv_discount_pct(
         self,
@@ -1074,7 +1416,14 @@ class NegotiationEngine:
         previous: OfferComponents | None,
         current: OfferComponents,
         vendor: VendorProfile,
+        *,
+        record_notes: bool = True,
     ) -> List[str]:
+        """Reprice ``current`` in place so lever changes respect the exchange policy.
+
+        Returns human-readable notes for each adjustment; pass
+        ``record_notes=False`` when only the repriced offer is needed.
+        """
         if previous is None:
             return []
 
@@ -1088,14 +1437,16 @@ class NegotiationEngine:
             required_price = prev_price * (1 - term_discount)
             if required_price < floor:
                 required_price = floor
-                notes.append(
-                    "Term trade constrained by vendor floor"
-                )
+                if record_notes:
+                    notes.append(
+                        "Term trade constrained by vendor floor"
+                    )
             if current.unit_price > required_price + 0.01:
                 current.unit_price = round(required_price, 2)
-                notes.append(
-                    f"Applied term trade discount ≥{term_discount:.1%} for +{current.term_months - previous.term_months}mo"
-                )
+                if record_notes:
+                    notes.append(
+                        f"Applied term trade discount ≥{term_discount:.1%} for +{current.term_months - previous.term_months}mo"
+                    )
 
         # Payment term compensation
         prev_offset = policy.payment_trade.get(previous.payment_terms, 0.0)
@@ -1111,25 +1462,25 @@ class NegotiationEngine:
                 required_price = prev_price * (1 - required_pct)
                 if required_price < floor:
                     required_price = floor
-                    notes.append("Payment discount constrained by vendor floor")
+                    if record_notes:
+                        notes.append("Payment discount constrained by vendor floor")
                 if current.unit_price > required_price + 0.01:
                     current.unit_price = round(required_price, 2)
-                    notes.append(
-                        f"Faster payment ({previous.payment_terms.value}→{current.payment_terms.value}) enforced ≥{required_pct:.1%} price drop"
-                    )
+                    if record_notes:
+                        notes.append(
+                            f"Faster payment ({previous.payment_terms.value}→{current.payment_terms.value}) enforced ≥{required_pct:.1%} price drop"
+                        )
             else:
                 allowed_increase = -delta_offset
                 allowed_price = prev_price * (1 + allowed_increase)
                 if current.unit_price > allowed_price + 0.01:
                     current.unit_price = round(allowed_price, 2)
-                    notes.append(
-                        f"Slower payment premium capped at {allowed_increase:.1%}"
-                    )
-
-        if current.unit_price < floor:
-            current.unit_price = round(floor, 2)
+                    if record_notes:
+                        notes.append(
+                            f"Slower payment premium capped at {allowed_increase:.1%}"
+                        )
 
-        current.unit_price = round(current.unit_price, 2)
+        current.unit_price = round(max(current.unit_price, floor), 2)
         return notes
 
     def _payment_discount(self, policy: ExchangePolicy, terms: PaymentTerms) -> float:
@@ -1139,14 +1490,7 @@ class NegotiationEngine:
         return policy.value_add_offsets.get(value_type, 0.0)
 
     def _seller_payment_preference(self, payment_terms: PaymentTerms) -> float:
-        mapping = {
-            PaymentTerms.NET_15: 1.0,
-            PaymentTerms.NET_30: 0.9,
-            PaymentTerms.NET_45: 0.7,
-            PaymentTerms.MILESTONES: 0.85,
-            PaymentTerms.DEPOSIT: 1.0,
-        }
-        return mapping.get(payment_terms, 0.7)
+        return SELLER_PAYMENT_PREFERENCE.get(payment_terms, 0.7)
 class NegotiationLifecycle(Enum):
     INIT = "init"
     NEGOTIATING = "negotiating"
@@ -1160,144 +1504,3 @@ BUYER_ACCEPT_THRESHOLD = 0.75
 # Allow sellers to clear deals even at absolute floor while still tracking minimal utility
 SELLER_ACCEPT_THRESHOLD = 0.10
 MAX_STALLED_ROUNDS = 3
-
-
-class ConcessionEngine:
-    """Utility to convert vendor concessions to monetary impacts."""
-
-    def __init__(self, record_metadata: Dict[str, object]) -> None:
-        self.term_trade: Dict[int, float] = {
-            int(k): float(v) for k, v in record_metadata.get("term_trade", {}).items()
-        }
-        self.payment_trade: Dict[str, float] = {
-            str(k): float(v) for k, v in record_metadata.get("payment_trade", {}).items()
-        }
-        self.value_add_offsets: Dict[str, float] = {
-            str(k): float(v) for k, v in record_metadata.get("value_add_offsets", {}).items()
-        }
-
-    def best_effective_price(
-        self,
-        *,
-        list_price: float,
-        floor_price: float,
-        seats: int,
-    ) -> Tuple[float, List[str]]:
-        """Evaluate combinations of levers to find the best effective price."""
-        best_price = list_price
-        best_applied: List[str] = []
-
-        # Generate all possible combinations
-        combinations = self._generate_combinations(list_price, seats)
-
-        for combo_price, combo_applied in combinations:
-            if combo_price >= floor_price and combo_price < best_price:
-                best_price = combo_price
-                best_applied = combo_applied
-
-        return best_price, best_applied
-
-    def _generate_combinations(self, list_price: float, seats: int) -> List[Tuple[float, List[str]]]:
-        """Generate all valid combinations of concessions."""
-        combinations = []
-
-        # Start with no concessions
-        combinations.append((list_price, []))
-
-        # Single lever concessions
-        # Payment concessions only
-        for term, discount in self.payment_trade.items():
-            if discount > 0:
-                price = list_price * (1 - discount)
-                applied = [f"payment:{term}:{discount:.2%}"]
-                combinations.append((price, applied))
-
-        # Term concessions only
-        for delta, discount in self.term_trade.items():
-            if discount > 0:
-                price = list_price * (1 - discount)
-                applied = [f"term:+{delta}:{discount:.2%}"]
-                combinations.append((price, applied))
-
-        # Value-add credits only
-        if seats > 0 and self.value_add_offsets:
-            total_credit = sum(self.value_add_offsets.values())
-            per_seat_credit = total_credit / seats
-            price = list_price - per_seat_credit
-            applied = [f"value_add:${total_credit:.2f}"]
-            combinations.append((price, applied))
-
-        # Combined lever concessions
-        # Payment + Term combinations
-        for term_key, payment_discount in self.payment_trade.items():
-            if payment_discount <= 0:
-                continue
-            for delta, term_discount in self.term_trade.items():
-                if term_discount <= 0:
-                    continue
-                # Apply both discounts (multiplicative)
-                price = list_price * (1 - payment_discount) * (1 - term_discount)
-                applied = [
-                    f"payment:{term_key}:{payment_discount:.2%}",
-                    f"term:+{delta}:{term_discount:.2%}"
-                ]
-                combinations.append((price, applied))
-
-        # Payment + Value-add combinations
-        if seats > 0 and self.value_add_offsets:
-            total_credit = sum(self.value_add_offsets.values())
-            per_seat_credit = total_credit / seats
-            for term_key, payment_discount in self.payment_trade.items():
-                if payment_discount <= 0:
-                    continue
-                # Apply payment discount and subtract value-add credit
-                price = (list_price * (1 - payment_discount)) - per_seat_credit
-                applied = [
-                    f"payment:{term_key}:{payment_discount:.2%}",
-                    f"value_add:${total_credit:.2f}"
-                ]
-                combinations.append((price, applied))
-
-        # Term + Value-add combinations
-        if seats > 0 and self.value_add_offsets:
-            total_credit = sum(self.value_add_offsets.values())
-            per_seat_credit = total_credit / seats
-            for delta, term_discount in self.term_trade.items():
-                if term_discount <= 0:
-                    continue
-                # Apply term discount and subtract value-add credit
-                price = (list_price * (1 - term_discount)) - per_seat_credit
-                applied = [
-                    f"term:+{delta}:{term_discount:.2%}",
-                    f"value_add:${total_credit:.2f}"
-                ]
-                combinations.append((price, applied))
-
-        # Triple combinations (Payment + Term + Value-add)
-        if seats > 0 and self.value_add_offsets:
-            total_credit = sum(self.value_add_offsets.values())
-            per_seat_credit = total_credit / seats
-
-            # Limit to top combinations to keep search manageable
-            top_payment_options = sorted(
-                [(k, v) for k, v in self.payment_trade.items() if v > 0],
-                key=lambda x: x[1], reverse=True
-            )[:2]  # Top 2 payment options
-
-            top_term_options = sorted(
-                [(k, v) for k, v in self.term_trade.items() if v > 0],
-                key=lambda x: x[1], reverse=True
-            )[:2]  # Top 2 term options
-
-            for term_key, payment_discount in top_payment_options:
-                for delta, term_discount in top_term_options:
-                    # Apply all three: payment discount, term discount, and value-add credit
-                    price = (list_price * (1 - payment_discount) * (1 - term_discount)) - per_seat_credit
-                    applied = [
-                        f"payment:{term_key}:{payment_discount:.2%}",
-                        f"term:+{delta}:{term_discount:.2%}",
-                        f"value_add:${total_credit:.2f}"
-                    ]
-                    combinations.append((price, applied))
-
-        return combinations
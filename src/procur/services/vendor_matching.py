@@ -9,6 +9,7 @@ from ..models import Request
 from ..data.seeds_loader import SeedVendorRecord
 from .evaluation import (
     FeatureMatchResult,
+    OptionalFeatures,
     ComplianceScore,
     compute_feature_score,
     compute_compliance_score,
@@ -204,7 +205,7 @@ def evaluate_vendor_against_request(
     record: SeedVendorRecord,
     *,
     budget_per_unit: Optional[float] = None,
-    optional_features: Optional[Dict[str, float]] = None,
+    optional_features: Optional[OptionalFeatures] = None,
 ) -> VendorMatchSummary:
     """
     Single authoritative path for vendor evaluation.
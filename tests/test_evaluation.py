@@ -8,10 +8,12 @@ from procur.services.evaluation import (
     TCOInputs,
     compute_tco,
     compute_buyer_utility,
+    compute_buyer_utility_batch,
     compute_seller_utility,
     compute_feature_score,
     compute_compliance_score,
     detect_zopa,
+    prepare_optional_features,
 )
 
 
@@ -42,6 +44,29 @@ def test_tco_case_b_prepay_discount():
     assert breakdown.total == Decimal("2850.00")
 
 
+def test_tco_prepay_discount_basis_points_matches_rate():
+    common = dict(unit_price=Decimal("33.33"), seats=7, term_months=9, payment_prepaid=True)
+    by_rate = compute_tco(TCOInputs(**common, prepay_discount_rate=Decimal("0.0375")))
+    by_bp = compute_tco(TCOInputs(**common, prepay_discount_bp=375))
+    assert by_bp == by_rate
+
+
+def test_tco_rounds_sub_cent_amounts_half_up():
+    breakdown = compute_tco(
+        TCOInputs(
+            unit_price=Decimal("0.125"),
+            seats=3,
+            term_months=4,
+            one_time_fees=Decimal("10.005"),
+            credits=Decimal("0.004"),
+        )
+    )
+    assert breakdown.base == Decimal("0.13")
+    assert breakdown.one_time_fees == Decimal("10.01")
+    assert breakdown.credits == Decimal("0.00")
+    assert breakdown.total == Decimal("10.14")
+
+
 def test_buyer_utility_increases_when_price_drops():
     util_high = compute_buyer_utility(
         unit_price=1200.0,
@@ -60,6 +85,30 @@ def test_buyer_utility_increases_when_price_drops():
     assert util_low.buyer_utility > util_high.buyer_utility
 
 
+def test_buyer_utility_batch_matches_scalar():
+    prices = [180.0, 900.0, 1200.0, 4000.0]
+    batch = compute_buyer_utility_batch(
+        unit_prices=prices,
+        budget_per_unit=900.0,
+        feature_scores=[1.0, 0.5, 0.75, 1.0],
+        compliance_scores=[1.0, 1.0, 0.4, 0.0],
+        sla_scores=[0.9, 0.7, 1.0, 0.5],
+    )
+    expected = [
+        compute_buyer_utility(
+            unit_price=price,
+            budget_per_unit=900.0,
+            feature_score=feature,
+            compliance_score=compliance,
+            sla_score=sla,
+        ).buyer_utility
+        for price, feature, compliance, sla in zip(
+            prices, [1.0, 0.5, 0.75, 1.0], [1.0, 1.0, 0.4, 0.0], [0.9, 0.7, 1.0, 0.5]
+        )
+    ]
+    assert batch == pytest.approx(expected)
+
+
 def test_feature_score_requires_all_must_haves():
     result = compute_feature_score(
         must_haves=["email integration", "pipeline tracking"],
@@ -79,6 +128,14 @@ def test_feature_score_partial_credit_when_some_match():
     assert result.missing == ["pipeline tracking"]
 
 
+def test_feature_score_accepts_prepared_optional_features():
+    optional = {"Workflows": 2.0, "Outlook": 1.0, "deal tracking": 1.0}
+    prepared = prepare_optional_features(optional)
+    for vendor_features in (["automation"], ["email", "pipeline"], []):
+        expected = compute_feature_score(["crm"], vendor_features, optional)
+        assert compute_feature_score(["crm"], vendor_features, prepared) == expected
+
+
 def test_compliance_blocking_when_missing():
     score = compute_compliance_score(["SOC2"], {"soc2": "none"})
     assert score.blocking is True
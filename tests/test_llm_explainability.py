@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import asyncio
+
+from procur.models import (
+    Offer,
+    OfferComponents,
+    OfferScore,
+    PaymentTerms,
+    Request,
+    RequestType,
+    VendorGuardrails,
+    VendorProfile,
+)
+from procur.services import LLMExplainabilityService
+
+
+class StubLLM:
+    def __init__(self, *contents):
+        self.contents = list(contents)
+        self.calls = []
+
+    def complete(self, **options):
+        self.calls.append(options)
+        return {"content": self.contents.pop(0), "usage": {"completion_tokens": 100}}
+
+
+def make_state(round_number: int = 1, unit_price: float = 200.0) -> dict:
+    request = Request(
+        request_id="req-explain",
+        requester_id="user-test",
+        type=RequestType.SAAS,
+        description="CRM software",
+        specs={"seats": 100},
+        quantity=100,
+        budget_max=25000.0,
+    )
+    vendor = VendorProfile(
+        vendor_id="vendor-explain",
+        name="ExplainVendor",
+        capability_tags=["crm"],
+        price_tiers={"100": 240.0},
+        guardrails=VendorGuardrails(price_floor=180.0),
+    )
+    offer = Offer(
+        offer_id=f"offer-{round_number}",
+        request_id=request.request_id,
+        vendor_id=vendor.vendor_id,
+        components=OfferComponents(
+            unit_price=unit_price,
+            currency="USD",
+            quantity=100,
+            term_months=12,
+            payment_terms=PaymentTerms.NET_30,
+        ),
+        score=OfferScore(spec_match=1.0, tco=20000.0, risk=0.1, time=0.9, utility=0.7),
+    )
+    return {
+        "request": request,
+        "vendor": vendor,
+        "latest_offer": offer,
+        "history": [offer],
+        "round_number": round_number,
+        "decision": "COUNTER",
+        "acceptance_probability": 0.4,
+        "policy_events": [],
+    }
+
+
+def valid_answer(service: LLMExplainabilityService, state: dict) -> str:
+    record = service._fallback_explanation(service.build_payload(**state), error="none")
+    return record.to_json().decode()
+
+
+def test_missing_content_falls_back():
+    service = LLMExplainabilityService(StubLLM(None, None))
+
+    record = service.explain_state(**make_state())
+    assert record.policy_summary[0].policy_id == "llm_fallback"
+
+    record = asyncio.run(service.explain_state_async(**make_state()))
+    assert record.policy_summary[0].policy_id == "llm_fallback"
+
+
+def test_validated_explanations_are_cached():
+    service = LLMExplainabilityService(StubLLM())
+    state = make_state()
+    service.llm_client.contents.append(valid_answer(service, state))
+
+    first = service.explain_state(**state)
+    second = service.explain_state(**state)
+
+    assert first is second
+    assert len(service.llm_client.calls) == 1
+
+
+def test_batch_shares_one_call():
+    service = LLMExplainabilityService(StubLLM())
+    states = [make_state(round_number=1), make_state(round_number=2, unit_price=190.0)]
+    answers = "\n".join(
+        f"[{index}] {valid_answer(service, state)}" for index, state in enumerate(states, start=1)
+    )
+    service.llm_client.contents.append(answers)
+
+    records = service.explain_states_batch(states)
+
+    assert len(service.llm_client.calls) == 1
+    assert [record.numeric_snapshots.latest_unit_price for record in records] == [200.0, 190.0]
+
+
+def test_output_budget_tracks_observed_lengths():
+    service = LLMExplainabilityService(StubLLM(), max_output_tokens=1500)
+    assert service._output_budget() == 1500
+
+    for _ in range(32):
+        service._observe_output({"usage": {"completion_tokens": 100}})
+    assert service._output_budget() == 111
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import json
+from datetime import datetime
 from pathlib import Path
 
 import pytest
@@ -13,18 +15,20 @@ from procur.models import (
     VendorGuardrails,
     VendorProfile,
 )
-from procur.models.enums import NegotiationDecision
+from procur.models.enums import ActorRole, NegotiationDecision
 from procur.services import (
     PolicyEngine,
     ScoringService,
     ComplianceService,
     GuardrailService,
     ExplainabilityService,
+    AuditLevel,
     AuditTrailService,
     MemoryService,
     RetrievalService,
 )
 from procur.services.negotiation_engine import (
+    ExchangePolicy,
     NegotiationEngine,
     NegotiationPlan,
     VendorNegotiationState,
@@ -128,6 +132,19 @@ def test_scoring_service_surfaces_missing_features():
     assert "sso" in score.missing_features
 
 
+def test_mandatory_certifications_match_exactly():
+    compliance = ComplianceService(mandatory_certifications=["soc2"])
+    request = make_request(budget_per_seat=900.0)
+    vendor = make_vendor(list_price=240.0, floor_price=180.0)  # certified "SOC2"
+
+    findings = compliance.evaluate_vendor(request, vendor)
+    assert any(finding.code == "missing_certification" for finding in findings)
+
+    card = compliance.build_risk_card(request, vendor)
+    assert card.controls[0].name == "soc2"
+    assert card.controls[0].compliant is False
+
+
 def test_seller_strategy_closes_at_floor():
     engine = make_engine()
     vendor = make_vendor(list_price=240.0, floor_price=180.0)
@@ -146,6 +163,25 @@ def test_seller_strategy_closes_at_floor():
     assert strategy.name == "CLOSE_DEAL"
 
 
+def test_opponent_model_summarises_older_offers():
+    opponent = OpponentModel(price_floor_estimate=180.0, price_ceiling_estimate=240.0)
+    for price in (240.0, 220.0, 210.0):
+        opponent.record_offer(
+            OfferComponents(
+                unit_price=price,
+                currency="USD",
+                quantity=200,
+                term_months=12,
+                payment_terms=PaymentTerms.NET_30,
+            )
+        )
+
+    assert [offer.unit_price for offer in opponent.last_offers] == [220.0, 210.0]
+    assert opponent.price_trend == pytest.approx(-10.0)
+    assert opponent.price_ema == pytest.approx(220.0)
+    assert opponent.price_variance == pytest.approx(150.0)
+
+
 def test_drop_outcome_state_flagged_correctly(monkeypatch):
     engine = make_engine()
     policy_engine = engine.policy_engine
@@ -234,3 +270,115 @@ def test_no_zopa_gate_blocks_vendor():
     vendor = apollo.to_vendor_profile()
     feasible = engine.feasible_with_trades(request, vendor, apollo.exchange_policy)
     assert feasible is False
+
+
+def test_acceptance_probability_batch_matches_scalar():
+    engine = make_engine()
+    request = make_request(budget_per_seat=100.0)
+    state = VendorNegotiationState(vendor=make_vendor(list_price=120.0, floor_price=80.0), round=3)
+    offers = [
+        OfferComponents(
+            unit_price=price,
+            currency="USD",
+            quantity=request.quantity,
+            term_months=term,
+            payment_terms=terms,
+        )
+        for price, term, terms in [
+            (95.0, 12, PaymentTerms.NET_30),
+            (110.0, 24, PaymentTerms.NET_15),
+            (70.0, 36, PaymentTerms.DEPOSIT),
+        ]
+    ]
+    expected = [engine.calculate_acceptance_probability(offer, request, state) for offer in offers]
+    assert engine.calculate_acceptance_probability_batch(offers, request, state) == pytest.approx(expected)
+
+
+def test_exchange_requirements_reprice_without_notes():
+    engine = make_engine()
+    vendor = make_vendor(list_price=120.0, floor_price=80.0)
+    policy = ExchangePolicy()
+    previous = OfferComponents(unit_price=110.0, currency="USD", quantity=200, term_months=12)
+
+    def counter() -> OfferComponents:
+        return OfferComponents(
+            unit_price=110.0,
+            currency="USD",
+            quantity=200,
+            term_months=24,
+            payment_terms=PaymentTerms.NET_15,
+        )
+
+    noted, silent = counter(), counter()
+    notes = engine.enforce_exchange_requirements(policy, previous, noted, vendor)
+    assert notes
+    assert engine.enforce_exchange_requirements(policy, previous, silent, vendor, record_notes=False) == []
+    assert silent.unit_price == noted.unit_price < 110.0
+
+
+def test_combined_discount_uses_supplied_date():
+    strategies = make_engine().advanced_strategies
+    request = make_request(budget_per_seat=100.0, quantity=50)
+    vendor = make_vendor(list_price=120.0, floor_price=80.0)
+    assert strategies.combined_discount(request, vendor, datetime(2024, 3, 25)) == pytest.approx(0.10)
+    assert strategies.combined_discount(request, vendor, datetime(2024, 12, 12)) == pytest.approx(0.12)
+    assert strategies.combined_discount(request, vendor, datetime(2024, 5, 1)) == 0.0
+
+
+def test_audit_trail_buffers_moves_until_export():
+    audit = AuditTrailService(max_buffered_moves=8)
+    components = OfferComponents(
+        unit_price=200.0,
+        currency="USD",
+        quantity=200,
+        term_months=12,
+        payment_terms=PaymentTerms.NET_30,
+    )
+    for round_number in (1, 2):
+        audit.record_move(
+            "req-test",
+            "vendor-test",
+            actor=ActorRole.BUYER_AGENT,
+            round_number=round_number,
+            offer=components,
+            lever="price",
+            rationale=["anchor"],
+            buyer_utility=0.8,
+            seller_utility=0.4,
+            tco=40000.0,
+            buyer_breakdown={"cost": 0.5},
+        )
+    audit.record_event("req-test", "round_complete")
+
+    assert audit.start_session("req-test", "vendor-test").moves == []
+    assert audit.component_totals("req-test", "vendor-test")["buyer_components"] == {"cost": 1.0}
+    exported = audit.export_sessions("req-test")
+    moves = exported["round_logs"]["vendor-test"]["moves"]
+    assert [move["round_number"] for move in moves] == [1, 2]
+    assert moves[0]["utility"]["buyer_components"] == {"cost": 0.5}
+    assert exported["events"] == [{"name": "round_complete", "payload": {}}]
+    encoded = json.loads(audit.export_sessions_json("req-test"))
+    assert [move["round_number"] for move in encoded["round_logs"]["vendor-test"]["moves"]] == [1, 2]
+    assert encoded["events"] == exported["events"]
+
+
+def test_audit_trail_off_records_nothing():
+    audit = AuditTrailService(audit_level=AuditLevel.OFF)
+    audit.record_event("req-test", "round_complete")
+    audit.finalize_session("req-test", "vendor-test", outcome="accepted")
+    assert audit.export_sessions("req-test") == {"round_logs": {}, "events": []}
+
+
+def test_memory_service_persists_finalized_sessions(tmp_path: Path):
+    db_path = tmp_path / "memory.db"
+    memory = MemoryService(db_path=db_path)
+    memory.start_session("req-test", "vendor-a", scenario_tags=["saas"])
+    memory.finalize_session("req-test", "vendor-a", outcome="accepted", savings=1200.0)
+    memory.start_session("req-test", "vendor-b")
+    memory.finalize_session("req-test", "vendor-b", outcome="dropped")
+
+    reopened = MemoryService(db_path=db_path)
+    restored = reopened.get_memory("req-test", "vendor-a")
+    assert restored is not None and restored.scenario_tags == ["saas"]
+    assert [m.vendor_id for m in reopened.iter_finalized(outcome="accepted", min_savings=1000.0)] == ["vendor-a"]
+    assert [m.vendor_id for m in reopened.iter_finalized(min_savings=0.0)] == ["vendor-a"]